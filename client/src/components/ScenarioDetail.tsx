@@ -183,6 +183,7 @@ export default function ScenarioDetail({ scenario, onBack, onUpdate }: ScenarioD
   useEffect(() => {
     loadProducts();
     checkExecutionStatus();
+    refreshScenario();
 
     // Auto-load comparison if scenario has been executed (has model_results)
     const hasResults = scenario.steps.some(step =>
@@ -204,6 +205,17 @@ export default function ScenarioDetail({ scenario, onBack, onUpdate }: ScenarioD
     };
   }, []);
 
+  const refreshScenario = async () => {
+    // The list payload leaves out heavy per-step fields (raw LLM responses),
+    // so fetch the full scenario when the detail view opens
+    try {
+      const response = await scenarioAPI.getScenario(scenario.scenario_id);
+      onUpdate(response.scenario);
+    } catch (err) {
+      console.error('Error refreshing scenario:', err);
+    }
+  };
+
   const checkExecutionStatus = async () => {
     try {
       const response = await scenarioAPI.getExecutionStatus(scenario.scenario_id);
@@ -1,8 +1,16 @@
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
-load_dotenv()
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """Load .env once per process, even across re-imports/reload paths"""
+    load_dotenv(override=False)
+
+
+_load_env()
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -24,15 +32,37 @@ class Settings:
     MONGODB_CLUSTER_URL: str = os.getenv("MONGODB_CLUSTER_URL", "cluster1.33ddyxh.mongodb.net")
     MONGODB_DATABASE: str = os.getenv("MONGODB_DATABASE", "avo_next")
 
-    @property
+    # MongoDB connection pool settings
+    MONGODB_MAX_POOL_SIZE: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "100"))
+    MONGODB_MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "10"))
+    MONGODB_MAX_IDLE_TIME_MS: int = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "60000"))
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "3000"))
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: int = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "2000"))
+
+    # Vertex AI settings
+    VERTEX_MAX_CONCURRENCY: int = int(os.getenv("VERTEX_MAX_CONCURRENCY", "8"))
+
+    # Comma-separated list of origins allowed by CORS; defaults cover the
+    # Vite dev server
+    CORS_ALLOW_ORIGINS: list = [
+        origin.strip()
+        for origin in os.getenv(
+            "CORS_ALLOW_ORIGINS",
+            "http://localhost:5173,http://127.0.0.1:5173"
+        ).split(",")
+        if origin.strip()
+    ]
+
+    @functools.cached_property
     def is_configured(self) -> bool:
+        # Cached: avoids a stat syscall on every health/chat request
         if self.GOOGLE_API_KEY:
             return True
         if self.GOOGLE_APPLICATION_CREDENTIALS:
             return Path(self.GOOGLE_APPLICATION_CREDENTIALS).exists()
         return False
 
-    @property
+    @functools.cached_property
     def mongodb_url(self) -> str:
         """Generate MongoDB connection URL"""
         if self.MONGODB_USERNAME and self.MONGODB_PASSWORD:
@@ -1,8 +1,10 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, ASCENDING
 from pymongo.database import Database
 from pymongo.collection import Collection
 from app.core.config import settings
 import logging
+import os
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +13,30 @@ class MongoDB:
     def __init__(self):
         self.client: MongoClient = None
         self.db: Database = None
-        self._connect()
+        self._pid: int = None
+        self._lock = threading.Lock()
+
+    def connect(self):
+        """Ensure a client exists for the current process (lazy, fork-safe).
+
+        PyMongo clients must not be shared across forks, so a client
+        inherited from a parent process is discarded and rebuilt. Connection
+        is attempted at most once per process.
+        """
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            if self.client is not None:
+                logger.info("Detected fork, re-creating MongoDB client for this worker")
+                self.client = None
+                self.db = None
+
+            self._connect()
+            self._pid = os.getpid()
 
     def _connect(self):
         """Initialize MongoDB connection"""
@@ -20,26 +45,50 @@ class MongoDB:
                 logger.warning("MongoDB URL not configured. Using in-memory storage.")
                 return
 
-            self.client = MongoClient(settings.mongodb_url)
+            # Pool connections so concurrent requests reuse open sockets
+            # instead of paying a TCP+TLS handshake per request.
+            self.client = MongoClient(
+                settings.mongodb_url,
+                maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+                minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+                maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+                serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+                waitQueueTimeoutMS=settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+                retryReads=True,
+                retryWrites=True
+            )
             self.db = self.client[settings.MONGODB_DATABASE]
 
             # Test connection
             self.client.admin.command('ping')
             logger.info(f"Successfully connected to MongoDB database: {settings.MONGODB_DATABASE}")
 
+            self._ensure_indexes()
+
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             self.client = None
             self.db = None
 
+    def _ensure_indexes(self):
+        """Create indexes once at startup (create_index is idempotent)"""
+        try:
+            self.db["products"].create_index(
+                [("product_id", ASCENDING)], unique=True, background=True
+            )
+        except Exception as e:
+            logger.warning(f"Failed to ensure indexes: {e}")
+
     def get_collection(self, collection_name: str) -> Collection:
         """Get a MongoDB collection"""
+        self.connect()
         if self.db is None:
             raise ConnectionError("MongoDB not connected")
         return self.db[collection_name]
 
     def is_connected(self) -> bool:
         """Check if MongoDB is connected"""
+        self.connect()
         return self.client is not None and self.db is not None
 
     def close(self):
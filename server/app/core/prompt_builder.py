@@ -2,53 +2,219 @@
 from typing import List, Optional
 from app.core.database import mongodb
 from app.models.scenario import CartItem
+import csv
+import io
 import logging
+import orjson
+import re
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Products change rarely, so the rendered catalog CSV is cached in-process
+# and refreshed at most once per TTL (or when products are mutated).
+CATALOG_TTL_SECONDS = 60.0
+
+_catalog_cache = {"csv": None, "expires": 0.0, "version": 0}
+_catalog_lock = threading.Lock()
+
+
+# Rendered CSV snapshot persisted in Mongo so prompt builds are a single-doc
+# fetch instead of an N-row transformation.
+CATALOG_SNAPSHOT_ID = "products_csv"
+
+
+def invalidate_catalog_cache():
+    """Force the next catalog read to rebuild from the database"""
+    with _catalog_lock:
+        _catalog_cache["csv"] = None
+        _catalog_cache["expires"] = 0.0
+        _catalog_cache["version"] += 1
+
+
+def get_catalog_version() -> int:
+    """Monotonic counter bumped on every product mutation.
+
+    Callers can key derived caches on it and skip recomputation while the
+    catalog is unchanged.
+    """
+    with _catalog_lock:
+        return _catalog_cache["version"]
+
+
+def rebuild_catalog_snapshot():
+    """Re-render the catalog CSV once and persist it for O(1) prompt builds"""
+    try:
+        if mongodb.is_connected():
+            catalog = _build_product_catalog_csv()
+            mongodb.get_collection("catalog_snapshots").replace_one(
+                {"_id": CATALOG_SNAPSHOT_ID},
+                {"_id": CATALOG_SNAPSHOT_ID, "csv": catalog, "updated_at": time.time()},
+                upsert=True
+            )
+            logger.info("Rebuilt catalog snapshot")
+    except Exception as e:
+        logger.error("Error rebuilding catalog snapshot: %s", e)
+    invalidate_catalog_cache()
+
+
+def _load_catalog_snapshot() -> Optional[str]:
+    """Fetch the precomputed catalog CSV snapshot, if one exists"""
+    try:
+        if mongodb.is_connected():
+            doc = mongodb.get_collection("catalog_snapshots").find_one({"_id": CATALOG_SNAPSHOT_ID})
+            if doc and doc.get("csv"):
+                return doc["csv"]
+    except Exception as e:
+        logger.warning("Error loading catalog snapshot: %s", e)
+    return None
+
 
 def get_product_catalog_csv() -> str:
-    """Get the product catalog as a CSV formatted string"""
+    """Get the product catalog as a CSV formatted string (cached with TTL)"""
+    if _catalog_cache["csv"] is not None and time.monotonic() < _catalog_cache["expires"]:
+        return _catalog_cache["csv"]
+
+    with _catalog_lock:
+        # Re-check under the lock in case another thread refreshed first
+        if _catalog_cache["csv"] is not None and time.monotonic() < _catalog_cache["expires"]:
+            return _catalog_cache["csv"]
+
+        catalog = _load_catalog_snapshot()
+        if catalog is None:
+            catalog = _build_product_catalog_csv()
+        _catalog_cache["csv"] = catalog
+        _catalog_cache["expires"] = time.monotonic() + CATALOG_TTL_SECONDS
+        return catalog
+
+
+CATALOG_CSV_FIELDS = ("id", "title", "units_relation", "main_unit_description", "secondary_unit_description")
+CATALOG_CSV_HEADER = '"id","title","units_relation","main_unit_description","secondary_unit_description"'
+
+
+def _aggregate_catalog_csv(collection) -> str:
+    """Build the catalog CSV server-side with a single aggregation round trip"""
+    quote = '"'
+    sep = '","'
+
+    def escaped(expr):
+        # Double embedded quotes, matching csv.QUOTE_ALL in the fallback path
+        return {"$replaceAll": {"input": expr, "find": quote, "replacement": quote * 2}}
+
+    pipeline = [
+        {"$project": {"_id": 0, "row": {"$concat": [
+            quote, escaped({"$toString": {"$ifNull": ["$product_id", {"$ifNull": ["$id", ""]}]}}),
+            sep, escaped({"$ifNull": ["$title", ""]}),
+            sep, {"$toString": {"$ifNull": ["$units_relation", 10]}},
+            sep, escaped({"$ifNull": ["$main_unit_description", "ΤΕΜΑΧΙΟ"]}),
+            sep, escaped({"$ifNull": ["$secondary_unit_description", "KOYTA"]}),
+            quote
+        ]}}},
+        {"$group": {"_id": None, "rows": {"$push": "$row"}}},
+        {"$project": {"_id": 0, "csv": {"$reduce": {
+            "input": "$rows",
+            "initialValue": CATALOG_CSV_HEADER,
+            "in": {"$concat": ["$$value", "\n", "$$this"]}
+        }}}}
+    ]
+
+    doc = next(collection.aggregate(pipeline), None)
+    if doc is None:
+        return CATALOG_CSV_HEADER
+    return doc["csv"]
+
+
+def _build_product_catalog_csv() -> str:
+    """Build the product catalog CSV string from the database"""
     try:
         if mongodb.is_connected():
             collection = mongodb.get_collection("products")
-            products = list(collection.find())
-
-            catalog_lines = ['"id","title","units_relation","main_unit_description","secondary_unit_description"']
-            for p in products:
-                p.pop('_id', None)
-                product_id = p.get('product_id', p.get('id', ''))
-                title = p.get('title', '')
-                units_relation = p.get('units_relation', 10)
-                main_unit = p.get('main_unit_description', 'ΤΕΜΑΧΙΟ')
-                secondary_unit = p.get('secondary_unit_description', 'KOYTA')
-                catalog_lines.append(f'"{product_id}","{title}","{units_relation}","{main_unit}","{secondary_unit}"')
-
-            logger.info(f"Loaded {len(products)} products for catalog")
-            return "\n".join(catalog_lines)
+
+            # Prefer building the CSV in the database: one document comes back
+            # over the wire instead of N decoded BSON rows.
+            try:
+                catalog = _aggregate_catalog_csv(collection)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Loaded %d products for catalog (server-side)", catalog.count("\n"))
+                return catalog
+            except Exception as e:
+                logger.warning("Server-side catalog aggregation failed, building client-side: %s", e)
+
+            # Project only the fields rendered into the CSV and stream the
+            # cursor directly instead of materializing full documents.
+            projection = {
+                "_id": 0,
+                "product_id": 1,
+                "id": 1,
+                "title": 1,
+                "units_relation": 1,
+                "main_unit_description": 1,
+                "secondary_unit_description": 1
+            }
+            cursor = collection.find({}, projection).batch_size(500)
+
+            # csv.writer handles RFC-4180 quoting in C code; rows are fed as a
+            # generator so the whole thing is one pass over the cursor.
+            buf = io.StringIO()
+            writer = csv.writer(buf, quoting=csv.QUOTE_ALL, lineterminator="\n")
+            writer.writerow(CATALOG_CSV_FIELDS)
+            writer.writerows(
+                (
+                    p.get('product_id') or p.get('id', ''),
+                    p.get('title', ''),
+                    p.get('units_relation', 10),
+                    p.get('main_unit_description', 'ΤΕΜΑΧΙΟ'),
+                    p.get('secondary_unit_description', 'KOYTA')
+                )
+                for p in cursor
+            )
+
+            catalog = buf.getvalue().rstrip("\n")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Loaded %d products for catalog", catalog.count("\n"))
+            return catalog
         else:
             logger.warning("MongoDB not connected, using empty catalog")
             return "No products available"
     except Exception as e:
-        logger.error(f"Error getting product catalog: {e}")
+        logger.error("Error getting product catalog: %s", e)
         return "Error loading catalog"
 
 
 def build_cart_json(cart_items: Optional[List[CartItem]]) -> str:
     """Build JSON representation of current cart state"""
-    if not cart_items or len(cart_items) == 0:
+    if not cart_items:
         return "[]"
 
-    import json
-    cart_list = []
-    for item in cart_items:
-        cart_list.append({
-            "id": item.product_id,
-            "quantity": item.quantity,
-            "unit": item.unit
-        })
+    # Compact orjson output: faster to serialize and fewer prompt tokens
+    return orjson.dumps([
+        {"id": item.product_id, "quantity": item.quantity, "unit": item.unit}
+        for item in cart_items
+    ]).decode()
+
+
+# Each unique template is parsed once into interleaved static parts and
+# placeholder names; rendering is then a single "".join per call. Keyed by
+# template content, so an edited prompt recompiles automatically. Bounded
+# because scenarios can carry bespoke multi-KB prompts.
+_PLACEHOLDER_RE = re.compile(r"\{\{(catalog|current_cart_json)\}\}")
+_compiled_templates: dict = {}
+_MAX_COMPILED_TEMPLATES = 128
+
 
-    return json.dumps(cart_list, ensure_ascii=False, indent=2)
+def _compile_template(template: str):
+    """Split a template into (statics, placeholders) arrays, cached by content"""
+    compiled = _compiled_templates.get(template)
+    if compiled is None:
+        parts = _PLACEHOLDER_RE.split(template)
+        statics = parts[0::2]
+        placeholders = parts[1::2]
+        compiled = (statics, placeholders)
+        while len(_compiled_templates) >= _MAX_COMPILED_TEMPLATES:
+            _compiled_templates.pop(next(iter(_compiled_templates)))
+        _compiled_templates[template] = compiled
+    return compiled
 
 
 def build_system_prompt(
@@ -62,25 +228,25 @@ def build_system_prompt(
     - {{catalog}} - Replaced with the product catalog from database
     - {{current_cart_json}} - Replaced with the current cart state as JSON
     """
-    catalog = get_product_catalog_csv()
-    cart_json = build_cart_json(current_cart)
-
-    catalog_lines = catalog.split('\n')
-    logger.info(f"Catalog has {len(catalog_lines)} lines (including header)")
-    if len(catalog_lines) > 1:
-        logger.info(f"Catalog header: {catalog_lines[0]}")
-        logger.info(f"First product: {catalog_lines[1] if len(catalog_lines) > 1 else 'N/A'}")
-    else:
-        logger.warning(f"Catalog appears empty or has issues: {catalog[:500]}")
-
-    prompt = template.replace("{{catalog}}", catalog)
-    prompt = prompt.replace("{{current_cart_json}}", cart_json)
-
-    if "{{catalog}}" in prompt:
-        logger.error("PLACEHOLDER {{catalog}} WAS NOT REPLACED!")
-    if "{{current_cart_json}}" in prompt:
-        logger.error("PLACEHOLDER {{current_cart_json}} WAS NOT REPLACED!")
-
-    logger.info(f"Built system prompt with {len(catalog)} chars of catalog data, cart has {len(current_cart) if current_cart else 0} items")
+    values = {
+        "catalog": get_product_catalog_csv(),
+        "current_cart_json": build_cart_json(current_cart)
+    }
+
+    statics, placeholders = _compile_template(template)
+
+    parts = [statics[0]]
+    for i, name in enumerate(placeholders):
+        parts.append(values[name])
+        parts.append(statics[i + 1])
+    prompt = "".join(parts)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        catalog = values["catalog"]
+        logger.debug("Catalog has %d lines (including header)", catalog.count("\n") + 1)
+        if not placeholders:
+            logger.debug("Template contains no placeholders to replace")
+        logger.debug("Built system prompt with %d chars of catalog data, cart has %d items",
+                     len(catalog), len(current_cart) if current_cart else 0)
 
     return prompt
@@ -0,0 +1,89 @@
+import sqlite3
+import threading
+import zlib
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Lives next to the uploaded voice files; both are node-local artifacts
+DB_PATH = Path("uploads") / "raw_responses.db"
+
+
+class RawResponseStore:
+    """Small on-disk key-value store for raw LLM responses.
+
+    Raw responses are the largest per-step artifact (full JSON/XML payloads)
+    and are only viewed on demand, so they are kept out of the scenario
+    documents: MongoDB writes stay small and scenario snapshots stay cheap to
+    serialize. Entries are zlib-compressed and keyed by
+    (scenario_id, step_id, model_name).
+    """
+
+    def __init__(self, db_path: Path = DB_PATH):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS raw_responses (
+                scenario_id TEXT NOT NULL,
+                step_id TEXT NOT NULL,
+                model_name TEXT NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (scenario_id, step_id, model_name)
+            )
+            """
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def put(self, scenario_id: str, step_id: str, model_name: str, raw_response: Optional[str]):
+        """Store (or overwrite) the raw response for one step/model pair"""
+        if raw_response is None:
+            return
+        blob = zlib.compress(raw_response.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO raw_responses VALUES (?, ?, ?, ?)",
+                (scenario_id, step_id, model_name, blob)
+            )
+            self._conn.commit()
+
+    def get(self, scenario_id: str, step_id: str, model_name: str) -> Optional[str]:
+        """Fetch a single raw response, or None if not stored"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM raw_responses "
+                "WHERE scenario_id = ? AND step_id = ? AND model_name = ?",
+                (scenario_id, step_id, model_name)
+            ).fetchone()
+        if row is None:
+            return None
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def get_for_scenario(self, scenario_id: str) -> Dict[Tuple[str, str], str]:
+        """Fetch all raw responses for a scenario, keyed by (step_id, model)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT step_id, model_name, data FROM raw_responses WHERE scenario_id = ?",
+                (scenario_id,)
+            ).fetchall()
+        return {
+            (step_id, model_name): zlib.decompress(blob).decode("utf-8")
+            for step_id, model_name, blob in rows
+        }
+
+    def delete_scenario(self, scenario_id: str):
+        """Drop all raw responses belonging to a scenario"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM raw_responses WHERE scenario_id = ?",
+                (scenario_id,)
+            )
+            self._conn.commit()
+
+
+# Singleton instance
+raw_response_store = RawResponseStore()
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field
+from functools import cached_property
+from operator import attrgetter
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -21,6 +23,11 @@ class CartItem(BaseModel):
     unit: str = Field(default="KOYTA", description="Unit type: KOYTA (package) or ΤΕΜΑΧΙΟ (piece)")
 
 
+# Hydrates a whole list of cart-item dicts in one core-schema pass instead of
+# per-element BaseModel construction.
+CartItemListAdapter: TypeAdapter = TypeAdapter(List[CartItem])
+
+
 class ModelExecutionResult(BaseModel):
     """Results from executing a step with a specific model"""
     model_name: str
@@ -92,6 +99,27 @@ class Scenario(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
+    @cached_property
+    def step_index(self) -> Dict[str, "ScenarioStep"]:
+        """O(1) lookup of steps by step_id (invalidate after step CRUD)"""
+        return {step.step_id: step for step in self.steps}
+
+    @cached_property
+    def steps_sorted(self) -> List["ScenarioStep"]:
+        """Steps ordered by step_number, computed once per scenario instance"""
+        return sorted(self.steps, key=attrgetter("step_number"))
+
+    @cached_property
+    def steps_with_audio(self) -> int:
+        """Number of steps with an uploaded voice file, computed once per instance"""
+        return sum(1 for step in self.steps if step.voice_file_path)
+
+    def invalidate_step_caches(self):
+        """Drop the cached step index/ordering after mutating self.steps"""
+        self.__dict__.pop("step_index", None)
+        self.__dict__.pop("steps_sorted", None)
+        self.__dict__.pop("steps_with_audio", None)
+
 
 # Request/Response models
 class CreateScenarioRequest(BaseModel):
@@ -113,6 +141,7 @@ class CreateStepRequest(BaseModel):
 
 
 class UpdateStepRequest(BaseModel):
+    voice_file_path: Optional[str] = None
     voice_text: Optional[str] = None
     llm_transcription: Optional[str] = None
     ai_response: Optional[str] = None
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException
-from app.models.product import Product, ProductListResponse, CreateProductRequest, UpdateProductRequest
+from fastapi.responses import ORJSONResponse
+from app.models.product import Product, CreateProductRequest, UpdateProductRequest
 from app.core.database import mongodb
 from app.core.products_data import get_products_from_csv
+from app.core.prompt_builder import rebuild_catalog_snapshot
+from app.services.order_generation import order_generation_service
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,49 +13,74 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/products", tags=["products"])
 
 
+# Synchronous pymongo calls would block the event loop inside async handlers,
+# serializing all requests on the worker. Each handler below runs its blocking
+# DB work in a worker thread via asyncio.to_thread so the loop stays free.
+
+
 @router.post("/seed")
 async def seed_products():
     """Seed products database from CSV data"""
-    try:
+    def _seed():
         if not mongodb.is_connected():
             raise HTTPException(status_code=500, detail="MongoDB not connected")
 
         collection = mongodb.get_collection("products")
-        collection.drop_indexes()
-        collection.delete_many({})
+        # Dropping the collection is O(1) versus per-doc index maintenance in
+        # delete_many; recreating the unique index before the bulk insert
+        # lets writes maintain it incrementally instead of a post-hoc scan.
+        collection.drop()
+        collection.create_index("product_id", unique=True)
 
-        products_data = get_products_from_csv()
-        products = [Product(**p) for p in products_data]
+        # Seed data is already plain dicts; validate the shape once against
+        # the model instead of paying a full pydantic round trip per product.
+        docs = get_products_from_csv()
+        if docs:
+            Product(**docs[0])
 
-        collection.insert_many([p.model_dump(mode='json') for p in products])
-        collection.create_index("product_id", unique=True)
+        # ordered=False lets the server pipeline the inserts and surface
+        # per-document duplicate errors without aborting the batch. Shallow
+        # copies are required: insert_many injects an _id into each dict in
+        # place, and docs is the module-level PRODUCTS constant itself.
+        collection.insert_many([dict(doc) for doc in docs], ordered=False)
 
-        logger.info(f"Seeded {len(products)} products into database")
-        return {"message": f"Successfully seeded {len(products)} products"}
+        rebuild_catalog_snapshot()
+        order_generation_service.invalidate_catalog()
+        logger.info(f"Seeded {len(docs)} products into database")
+        return {"message": f"Successfully seeded {len(docs)} products"}
 
+    try:
+        return await asyncio.to_thread(_seed)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error seeding products: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/", response_model=ProductListResponse)
+@router.get("/", response_class=ORJSONResponse)
 async def list_products():
     """List all available products"""
-    try:
+    def _list():
         if not mongodb.is_connected():
             raise HTTPException(status_code=500, detail="MongoDB not connected")
 
         collection = mongodb.get_collection("products")
-        products = []
+        docs = []
 
-        for doc in collection.find():
-            doc.pop('_id', None)
+        # Docs were validated on write, so they go straight from the cursor
+        # to orjson with no pydantic pass on the read path.
+        for doc in collection.find({}, {"_id": 0}):
             if 'id' in doc and 'product_id' not in doc:
                 doc['product_id'] = str(doc.pop('id'))
-            products.append(Product(**doc))
+            docs.append(doc)
 
-        return ProductListResponse(products=products, total=len(products))
+        return {"products": docs, "total": len(docs)}
 
+    try:
+        return await asyncio.to_thread(_list)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing products: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -60,14 +89,13 @@ async def list_products():
 @router.get("/{product_id}", response_model=Product)
 async def get_product(product_id: str):
     """Get a specific product by ID"""
-    try:
+    def _get():
         if not mongodb.is_connected():
             raise HTTPException(status_code=500, detail="MongoDB not connected")
 
         collection = mongodb.get_collection("products")
+        # Single lookup on the indexed product_id field (no legacy "id" scan)
         doc = collection.find_one({"product_id": product_id})
-        if not doc:
-            doc = collection.find_one({"id": product_id})
 
         if not doc:
             raise HTTPException(status_code=404, detail="Product not found")
@@ -77,6 +105,8 @@ async def get_product(product_id: str):
             doc['product_id'] = str(doc.pop('id'))
         return Product(**doc)
 
+    try:
+        return await asyncio.to_thread(_get)
     except HTTPException:
         raise
     except Exception as e:
@@ -87,7 +117,7 @@ async def get_product(product_id: str):
 @router.post("/", response_model=Product)
 async def create_product(request: CreateProductRequest):
     """Create a new product"""
-    try:
+    def _create():
         if not mongodb.is_connected():
             raise HTTPException(status_code=500, detail="MongoDB not connected")
 
@@ -107,10 +137,14 @@ async def create_product(request: CreateProductRequest):
         )
 
         collection.insert_one(product.model_dump(mode='json'))
+        rebuild_catalog_snapshot()
+        order_generation_service.invalidate_catalog()
         logger.info(f"Created product: {product.product_id}")
 
         return product
 
+    try:
+        return await asyncio.to_thread(_create)
     except HTTPException:
         raise
     except Exception as e:
@@ -121,7 +155,7 @@ async def create_product(request: CreateProductRequest):
 @router.put("/{product_id}", response_model=Product)
 async def update_product(product_id: str, request: UpdateProductRequest):
     """Update an existing product"""
-    try:
+    def _update():
         if not mongodb.is_connected():
             raise HTTPException(status_code=500, detail="MongoDB not connected")
 
@@ -145,6 +179,8 @@ async def update_product(product_id: str, request: UpdateProductRequest):
 
         if update_data:
             collection.update_one({"product_id": product_id}, {"$set": update_data})
+            rebuild_catalog_snapshot()
+            order_generation_service.invalidate_catalog()
             logger.info(f"Updated product: {product_id}")
 
         # Return updated product
@@ -152,6 +188,8 @@ async def update_product(product_id: str, request: UpdateProductRequest):
         doc.pop('_id', None)
         return Product(**doc)
 
+    try:
+        return await asyncio.to_thread(_update)
     except HTTPException:
         raise
     except Exception as e:
@@ -162,7 +200,7 @@ async def update_product(product_id: str, request: UpdateProductRequest):
 @router.delete("/{product_id}")
 async def delete_product(product_id: str):
     """Delete a product"""
-    try:
+    def _delete():
         if not mongodb.is_connected():
             raise HTTPException(status_code=500, detail="MongoDB not connected")
 
@@ -173,9 +211,13 @@ async def delete_product(product_id: str):
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Product not found")
 
+        rebuild_catalog_snapshot()
+        order_generation_service.invalidate_catalog()
         logger.info(f"Deleted product: {product_id}")
         return {"message": f"Product '{product_id}' deleted successfully"}
 
+    try:
+        return await asyncio.to_thread(_delete)
     except HTTPException:
         raise
     except Exception as e:
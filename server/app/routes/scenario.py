@@ -1,27 +1,36 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import APIRouter, HTTPException, UploadFile, File, BackgroundTasks, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 from app.models.scenario import (
     CreateScenarioRequest, UpdateScenarioRequest,
     CreateStepRequest, UpdateStepRequest,
     ScenarioListResponse, ScenarioResponse, Scenario, CartItem, ScenarioStep,
-    UpdateStepModelResultRequest, MODELS_TO_EXECUTE
+    UpdateStepModelResultRequest, MODELS_TO_EXECUTE, CartItemListAdapter
 )
 from app.services.scenario import scenario_service
 from app.services.chat import chat_service
 from app.services.transcription import transcription_service
 from app.services.order_generation import order_generation_service
 from app.core.prompt_builder import build_system_prompt
+import io
 import logging
 import os
 import asyncio
+import time
 from pathlib import Path
 from typing import Dict, Optional, List
 from enum import Enum
 from datetime import datetime
-from collections import deque
-from pydantic import BaseModel
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from pydantic import BaseModel, field_serializer
 
 logger = logging.getLogger(__name__)
 
+# Derived once at import; the model list is fixed for the process lifetime
+TOTAL_MODELS = len(MODELS_TO_EXECUTE)
+FIRST_MODEL = MODELS_TO_EXECUTE[0] if MODELS_TO_EXECUTE else None
+
 
 class ExecutionStatus(str, Enum):
     PENDING = "pending"
@@ -34,9 +43,15 @@ class ExecutionStatus(str, Enum):
 class QueuedScenario(BaseModel):
     scenario_id: str
     scenario_name: str
-    queued_at: str
+    # Raw epoch timestamp; rendered to ISO only when serialized out, so
+    # enqueueing skips the datetime/strftime work entirely
+    queued_at: float
     priority: int = 0
 
+    @field_serializer("queued_at")
+    def _format_queued_at(self, value: float) -> str:
+        return datetime.fromtimestamp(value).isoformat()
+
 
 class ExecutionQueueStatus(BaseModel):
     queue: List[QueuedScenario]
@@ -44,15 +59,101 @@ class ExecutionQueueStatus(BaseModel):
     is_batch_running: bool = False
 
 
+@dataclass(slots=True)
+class ExecutionState:
+    """Mutable per-scenario execution progress.
+
+    Slots make attribute reads cheaper than the dict lookups they replace
+    and avoid allocating a fresh key table per enqueue; FastAPI serializes
+    it into the same JSON shape the old dicts had.
+    """
+    status: ExecutionStatus = ExecutionStatus.PENDING
+    current_model: Optional[str] = None
+    current_model_index: int = 0
+    total_models: int = 0
+    current_step: int = 0
+    total_steps: int = 0
+    steps_processed: int = 0
+    steps_skipped: int = 0
+    steps_failed: int = 0
+    models_completed: int = 0
+    error: Optional[str] = None
+    model_progress: Optional[Dict[str, Dict]] = None
+    parallel_execution: bool = False
+    is_single_step: bool = False
+    step_id: Optional[str] = None
+    queued: bool = False
+    queue_position: Optional[int] = None
+    message: Optional[str] = None
+
+
+# Per-scenario tracking state would otherwise grow monotonically: every
+# scenario ever executed leaves status, logs and a lock behind
+MAX_TRACKED_SCENARIOS = 512
+
+
+class BoundedScenarioDict(OrderedDict):
+    """OrderedDict that evicts its least-recently-used entries past the cap.
+
+    Supports an optional default factory so it can stand in for the
+    defaultdict-based log/lock maps.
+    """
+
+    def __init__(self, default_factory=None):
+        super().__init__()
+        self._default_factory = default_factory
+
+    def __getitem__(self, key):
+        try:
+            value = super().__getitem__(key)
+        except KeyError:
+            if self._default_factory is None:
+                raise
+            value = self._default_factory()
+            self[key] = value
+            return value
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > MAX_TRACKED_SCENARIOS:
+            self.popitem(last=False)
+
+
 # Track execution status for each scenario
-execution_status: Dict[str, Dict] = {}
-cancelled_scenarios: set = set()
-execution_queue: deque = deque()
+execution_status: Dict[str, ExecutionState] = BoundedScenarioDict()
+# Cancellation is signalled through events so waiting tasks can react to it
+# immediately instead of polling a set between steps
+cancel_events: Dict[str, asyncio.Event] = BoundedScenarioDict(asyncio.Event)
+# Insertion-ordered dict: O(1) duplicate checks and O(1) removal while
+# preserving queue order (dicts keep insertion order)
+execution_queue: Dict[str, QueuedScenario] = {}
+# Serializes compound check-then-append mutations of the queue so concurrent
+# enqueue requests can't interleave
+queue_lock = asyncio.Lock()
+# Scenarios currently executing, maintained at the status transitions so the
+# polling endpoints don't have to scan execution_status
+running_scenarios: set = set()
 batch_execution_running = False
 batch_execution_task = None
-execution_logs: Dict[str, List[Dict]] = {}
-
-router = APIRouter(prefix="/api/scenarios", tags=["scenarios"])
+# Bounded deques trim old entries in O(1) instead of re-slicing per log line
+execution_logs: Dict[str, deque] = BoundedScenarioDict(lambda: deque(maxlen=100))
+# Per-scenario locks serialize compound read-modify-write status updates
+# issued from concurrently running tasks
+status_locks: Dict[str, asyncio.Lock] = BoundedScenarioDict(asyncio.Lock)
+# Live SSE subscribers per scenario; each gets new log records pushed as
+# they are appended instead of polling snapshots
+log_subscribers: Dict[str, List[asyncio.Queue]] = BoundedScenarioDict(list)
+
+# orjson handles the large scenario/log/comparison payloads much faster than
+# the stdlib encoder FastAPI uses by default
+router = APIRouter(
+    prefix="/api/scenarios",
+    tags=["scenarios"],
+    default_response_class=ORJSONResponse
+)
 
 # Create uploads directory
 UPLOAD_DIR = Path("uploads/voice_files")
@@ -60,31 +161,64 @@ UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def add_execution_log(scenario_id: str, level: str, message: str, details: Optional[Dict] = None):
-    """Add a log entry for scenario execution"""
-    if scenario_id not in execution_logs:
-        execution_logs[scenario_id] = []
-
-    log_entry = {
-        "timestamp": datetime.now().isoformat(),
-        "level": level,
-        "message": message,
-        "details": details or {}
-    }
-    execution_logs[scenario_id].append(log_entry)
+    """Add a log entry for scenario execution.
+
+    Records are stored as compact (timestamp, level, message, details) tuples;
+    dict construction and timestamp formatting are deferred to the read
+    endpoints so the hot execution path only pays for a tuple append.
+    """
+    record = (time.time(), level, message, details)
+    execution_logs[scenario_id].append(record)
+    for queue in log_subscribers.get(scenario_id, ()):
+        try:
+            queue.put_nowait(record)
+        except asyncio.QueueFull:
+            # A stalled client loses entries rather than backpressuring execution
+            pass
 
-    if len(execution_logs[scenario_id]) > 100:
-        execution_logs[scenario_id] = execution_logs[scenario_id][-100:]
+
+def format_log_timestamp(ts: float) -> str:
+    """Format a time.time() value as an ISO-8601 UTC string.
+
+    time.strftime over gmtime avoids the datetime object construction and
+    local-timezone lookup that datetime.now().isoformat() pays per call.
+    """
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(ts))}.{int((ts % 1) * 1e6):06d}"
+
+
+def format_execution_logs(records) -> List[Dict]:
+    """Expand stored log tuples into the dict shape the client expects"""
+    return [
+        {
+            "timestamp": format_log_timestamp(ts),
+            "level": level,
+            "message": message,
+            "details": details or {}
+        }
+        for ts, level, message, details in records
+    ]
+
+
+def request_scenario_cancel(scenario_id: str):
+    cancel_events[scenario_id].set()
+
+
+def clear_scenario_cancel(scenario_id: str):
+    event = cancel_events.get(scenario_id)
+    if event is not None:
+        event.clear()
 
 
 def is_scenario_cancelled(scenario_id: str) -> bool:
-    return scenario_id in cancelled_scenarios
+    event = cancel_events.get(scenario_id)
+    return event is not None and event.is_set()
 
 
 @router.post("/", response_model=ScenarioResponse)
 async def create_scenario(request: CreateScenarioRequest):
     """Create a new scenario"""
     try:
-        scenario = scenario_service.create_scenario(request)
+        scenario = await asyncio.to_thread(scenario_service.create_scenario, request)
         return ScenarioResponse(scenario=scenario)
     except Exception as e:
         logger.error(f"Error creating scenario: {e}")
@@ -95,7 +229,7 @@ async def create_scenario(request: CreateScenarioRequest):
 async def list_scenarios():
     """List all scenarios"""
     try:
-        scenarios = scenario_service.list_scenarios()
+        scenarios = await asyncio.to_thread(scenario_service.list_scenarios)
         return ScenarioListResponse(scenarios=scenarios, total=len(scenarios))
     except Exception as e:
         logger.error(f"Error listing scenarios: {e}")
@@ -105,7 +239,7 @@ async def list_scenarios():
 @router.get("/{scenario_id}", response_model=ScenarioResponse)
 async def get_scenario(scenario_id: str):
     """Get a specific scenario"""
-    scenario = scenario_service.get_scenario(scenario_id)
+    scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
     return ScenarioResponse(scenario=scenario)
@@ -114,7 +248,7 @@ async def get_scenario(scenario_id: str):
 @router.put("/{scenario_id}", response_model=ScenarioResponse)
 async def update_scenario(scenario_id: str, request: UpdateScenarioRequest):
     """Update scenario metadata"""
-    scenario = scenario_service.update_scenario(scenario_id, request)
+    scenario = await asyncio.to_thread(scenario_service.update_scenario, scenario_id, request)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
     return ScenarioResponse(scenario=scenario)
@@ -123,7 +257,7 @@ async def update_scenario(scenario_id: str, request: UpdateScenarioRequest):
 @router.delete("/{scenario_id}")
 async def delete_scenario(scenario_id: str):
     """Delete a scenario"""
-    success = scenario_service.delete_scenario(scenario_id)
+    success = await asyncio.to_thread(scenario_service.delete_scenario, scenario_id)
     if not success:
         raise HTTPException(status_code=404, detail="Scenario not found")
     return {"message": "Scenario deleted successfully"}
@@ -132,7 +266,7 @@ async def delete_scenario(scenario_id: str):
 @router.post("/{scenario_id}/clone", response_model=ScenarioResponse)
 async def clone_scenario(scenario_id: str, new_name: Optional[str] = None):
     """Clone/duplicate a scenario with all its steps"""
-    scenario = scenario_service.clone_scenario(scenario_id, new_name)
+    scenario = await asyncio.to_thread(scenario_service.clone_scenario, scenario_id, new_name)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
     return ScenarioResponse(scenario=scenario)
@@ -143,12 +277,13 @@ async def reset_scenario_prompt(scenario_id: str):
     """Reset a scenario's system prompt to the current default"""
     from app.services.settings import settings_service
 
-    scenario = scenario_service.get_scenario(scenario_id)
+    scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
 
-    default_prompt = settings_service.get_system_prompt()
-    updated = scenario_service.update_scenario(
+    default_prompt = await asyncio.to_thread(settings_service.get_system_prompt)
+    updated = await asyncio.to_thread(
+        scenario_service.update_scenario,
         scenario_id,
         UpdateScenarioRequest(system_prompt=default_prompt)
     )
@@ -163,7 +298,7 @@ async def reset_scenario_prompt(scenario_id: str):
 @router.put("/{scenario_id}/steps/{step_id}", response_model=dict)
 async def update_step(scenario_id: str, step_id: str, request: UpdateStepRequest):
     """Update a step in a scenario"""
-    step = scenario_service.update_step(scenario_id, step_id, request)
+    step = await asyncio.to_thread(scenario_service.update_step, scenario_id, step_id, request)
     if not step:
         raise HTTPException(status_code=404, detail="Scenario or step not found")
     return {"step": step}
@@ -172,7 +307,7 @@ async def update_step(scenario_id: str, step_id: str, request: UpdateStepRequest
 @router.post("/{scenario_id}/steps", response_model=dict)
 async def add_step(scenario_id: str, request: CreateStepRequest):
     """Add a new step to a scenario"""
-    step = scenario_service.add_step(scenario_id, request)
+    step = await asyncio.to_thread(scenario_service.add_step, scenario_id, request)
     if not step:
         raise HTTPException(status_code=404, detail="Scenario not found")
     return {"step": step}
@@ -181,7 +316,7 @@ async def add_step(scenario_id: str, request: CreateStepRequest):
 @router.delete("/{scenario_id}/steps/{step_id}")
 async def delete_step(scenario_id: str, step_id: str):
     """Delete a step from a scenario"""
-    success = scenario_service.delete_step(scenario_id, step_id)
+    success = await asyncio.to_thread(scenario_service.delete_step, scenario_id, step_id)
     if not success:
         raise HTTPException(status_code=404, detail="Scenario or step not found")
     return {"message": "Step deleted successfully"}
@@ -202,30 +337,52 @@ async def upload_voice_file(
         filename = f"{scenario_id}_{step_id}{file_extension}"
         file_path = UPLOAD_DIR / filename
 
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-
-        step = scenario_service.update_voice_file(scenario_id, step_id, str(file_path))
-        if not step:
-            os.remove(file_path)
+        # Stream the upload to disk in bounded chunks instead of buffering the
+        # whole file in memory; the blocking copy runs off the event loop.
+        # Chunks are teed into a BytesIO so transcription can run from memory
+        # without re-reading the file from disk. The file lands under a .part
+        # name first and is moved into place atomically, so a crash mid-write
+        # never leaves a truncated audio file at the final path.
+        def _write_upload() -> bytes:
+            buf = io.BytesIO()
+            tmp_path = file_path.with_suffix(file_path.suffix + ".part")
+            with open(tmp_path, "wb", buffering=1 << 20) as f:
+                while True:
+                    chunk = file.file.read(1 << 20)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    buf.write(chunk)
+            os.replace(tmp_path, file_path)
+            return buf.getvalue()
+
+        if not await asyncio.to_thread(scenario_service.get_step, scenario_id, step_id):
             raise HTTPException(status_code=404, detail="Scenario or step not found")
 
+        audio_bytes = await asyncio.to_thread(_write_upload)
+
         transcription = None
         try:
-            logger.info(f"Transcribing audio file: {file_path}")
-            transcription = await transcription_service.transcribe_audio_file(str(file_path))
-
-            if transcription:
-                scenario_service.update_step(
-                    scenario_id,
-                    step_id,
-                    UpdateStepRequest(voice_text=transcription)
-                )
-                logger.info(f"Transcription saved: {transcription[:100]}...")
+            logger.info(f"Transcribing uploaded audio: {file_path}")
+            mime_type = transcription_service.mime_type_for_suffix(file_extension)
+            transcription = await transcription_service.transcribe_audio_bytes(audio_bytes, mime_type)
         except Exception as e:
             logger.error(f"Failed to transcribe audio: {e}")
 
+        # Persist file path and transcription in one write instead of two
+        # back-to-back full-scenario rewrites
+        step = await asyncio.to_thread(
+            scenario_service.update_step,
+            scenario_id,
+            step_id,
+            UpdateStepRequest(voice_file_path=str(file_path), voice_text=transcription)
+        )
+        if not step:
+            os.remove(file_path)
+            raise HTTPException(status_code=404, detail="Scenario or step not found")
+        if transcription:
+            logger.info(f"Transcription saved: {transcription[:100]}...")
+
         return {
             "message": "Voice file uploaded successfully",
             "file_path": str(file_path),
@@ -265,17 +422,12 @@ async def process_scenario_step_for_model(
         logger.info(f"AI Response ({model_name}): {response_text[:100]}...")
         logger.info(f"Cart items extracted: {cart_items}")
 
-        predicted_cart = []
-        if cart_items:
-            for item in cart_items:
-                predicted_cart.append(CartItem(
-                    product_id=item.get("product_id", ""),
-                    product_name=item.get("product_name", ""),
-                    quantity=item.get("quantity", 0),
-                    unit=item.get("unit", "KOYTA")
-                ))
-
-        scenario_service.update_step_model_result(
+        # Validate the whole cart in one core-schema pass instead of
+        # constructing CartItem objects one by one
+        predicted_cart = CartItemListAdapter.validate_python(cart_items) if cart_items else []
+
+        await asyncio.to_thread(
+            scenario_service.update_step_model_result,
             scenario_id,
             step.step_id,
             UpdateStepModelResultRequest(
@@ -295,7 +447,8 @@ async def process_scenario_step_for_model(
 
     except Exception as e:
         logger.error(f"Error executing step {step.step_number} with {model_name}: {e}", exc_info=True)
-        scenario_service.update_step_model_result(
+        await asyncio.to_thread(
+            scenario_service.update_step_model_result,
             scenario_id,
             step.step_id,
             UpdateStepModelResultRequest(
@@ -310,9 +463,8 @@ async def execute_model_steps_sequential(
     scenario_id: str,
     model_name: str,
     steps_to_process: List[ScenarioStep],
-    all_steps: List[ScenarioStep],
+    prev_step: Optional[ScenarioStep],
     system_prompt: str,
-    step_ids: Optional[List[str]],
     model_progress: Dict[str, Dict]
 ) -> Dict:
     """Execute all steps sequentially for a single model"""
@@ -333,21 +485,18 @@ async def execute_model_steps_sequential(
                          {"model": model_name, "steps": len(steps_to_process)})
 
         current_cart: Optional[List[CartItem]] = None
+        cancel_event = cancel_events[scenario_id]
 
-        # Get initial cart from previous steps if re-running specific steps
-        if step_ids and steps_to_process:
-            first_step = steps_to_process[0]
-            prev_steps = [s for s in all_steps if s.step_number < first_step.step_number]
-            if prev_steps:
-                last_prev = prev_steps[-1]
-                if last_prev.model_results and model_name in last_prev.model_results:
-                    current_cart = last_prev.model_results[model_name].predicted_cart
-                    add_execution_log(scenario_id, "info",
-                                     f"[{model_name}] Using cart from step {last_prev.step_number}",
-                                     {"cart_items": len(current_cart) if current_cart else 0})
+        # Get initial cart from the immediate predecessor if re-running
+        # specific steps (located once by the caller, shared by all models)
+        if prev_step is not None and prev_step.model_results and model_name in prev_step.model_results:
+            current_cart = prev_step.model_results[model_name].predicted_cart
+            add_execution_log(scenario_id, "info",
+                             f"[{model_name}] Using cart from step {prev_step.step_number}",
+                             {"cart_items": len(current_cart) if current_cart else 0})
 
         for step_idx, step in enumerate(steps_to_process):
-            if is_scenario_cancelled(scenario_id):
+            if cancel_event.is_set():
                 result["success"] = False
                 result["error"] = "Cancelled"
                 add_execution_log(scenario_id, "warning", f"[{model_name}] Cancelled at step {step_idx + 1}")
@@ -363,9 +512,25 @@ async def execute_model_steps_sequential(
             add_execution_log(scenario_id, "info", f"[{model_name}] Processing step {step.step_number}",
                              {"step_id": step.step_id, "model": model_name})
 
-            predicted_cart = await process_scenario_step_for_model(
+            # Race the step against the cancel event so cancellation aborts
+            # the in-flight upstream call instead of waiting it out
+            step_task = asyncio.create_task(process_scenario_step_for_model(
                 scenario_id, step, session_id, system_prompt, model_name, current_cart
+            ))
+            cancel_task = asyncio.create_task(cancel_event.wait())
+            done, _ = await asyncio.wait(
+                {step_task, cancel_task},
+                return_when=asyncio.FIRST_COMPLETED
             )
+            if step_task not in done:
+                step_task.cancel()
+                result["success"] = False
+                result["error"] = "Cancelled"
+                add_execution_log(scenario_id, "warning",
+                                 f"[{model_name}] Cancelled during step {step.step_number}")
+                return result
+            cancel_task.cancel()
+            predicted_cart = step_task.result()
 
             if predicted_cart is not None:
                 result["steps_processed"] += 1
@@ -395,39 +560,38 @@ async def execute_model_steps_sequential(
 async def execute_scenario_background(scenario_id: str, step_ids: Optional[List[str]] = None):
     """Background task to execute all steps in a scenario with all models IN PARALLEL"""
     try:
-        cancelled_scenarios.discard(scenario_id)
-        execution_logs[scenario_id] = []
+        clear_scenario_cancel(scenario_id)
+        execution_logs[scenario_id].clear()
         add_execution_log(scenario_id, "info", "Starting scenario execution (parallel models)")
 
-        scenario = scenario_service.get_scenario(scenario_id)
+        scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
         if not scenario:
-            execution_status[scenario_id] = {
-                "status": ExecutionStatus.FAILED,
-                "error": "Scenario not found",
-                "current_model": None,
-                "current_model_index": 0,
-                "total_models": 0,
-                "current_step": 0,
-                "total_steps": 0
-            }
+            execution_status[scenario_id] = ExecutionState(
+                status=ExecutionStatus.FAILED,
+                error="Scenario not found"
+            )
             add_execution_log(scenario_id, "error", "Scenario not found")
             return
 
         if step_ids is None:
-            scenario_service.clear_step_model_results(scenario_id)
+            await asyncio.to_thread(scenario_service.clear_step_model_results, scenario_id)
             add_execution_log(scenario_id, "info", "Cleared previous execution results")
 
         system_prompt = scenario.system_prompt
-        all_steps = sorted(scenario.steps, key=lambda s: s.step_number)
-
-        if step_ids:
-            steps_to_process = [s for s in all_steps if s.step_id in step_ids and s.voice_file_path]
+        all_steps = scenario.steps_sorted
+
+        # Single filtering pass; the frozenset turns the per-step membership
+        # test from O(len(step_ids)) into O(1)
+        step_id_set = frozenset(step_ids) if step_ids else None
+        steps_to_process = [
+            s for s in all_steps
+            if s.voice_file_path and (step_id_set is None or s.step_id in step_id_set)
+        ]
+        if step_id_set is not None:
             add_execution_log(scenario_id, "info", f"Executing {len(steps_to_process)} specific step(s)")
-        else:
-            steps_to_process = [s for s in all_steps if s.voice_file_path]
 
         total_steps = len(steps_to_process)
-        total_models = len(MODELS_TO_EXECUTE)
+        total_models = TOTAL_MODELS
 
         # Track progress per model
         model_progress: Dict[str, Dict] = {
@@ -435,34 +599,40 @@ async def execute_scenario_background(scenario_id: str, step_ids: Optional[List[
             for model in MODELS_TO_EXECUTE
         }
 
-        execution_status[scenario_id] = {
-            "status": ExecutionStatus.RUNNING,
-            "current_model": "all (parallel)",
-            "current_model_index": total_models,
-            "total_models": total_models,
-            "current_step": 0,
-            "total_steps": total_steps,
-            "steps_processed": 0,
-            "steps_skipped": len(scenario.steps) - total_steps,
-            "steps_failed": 0,
-            "models_completed": 0,
-            "model_progress": model_progress,
-            "parallel_execution": True
-        }
+        execution_status[scenario_id] = ExecutionState(
+            status=ExecutionStatus.RUNNING,
+            current_model="all (parallel)",
+            current_model_index=total_models,
+            total_models=total_models,
+            total_steps=total_steps,
+            steps_skipped=len(scenario.steps) - total_steps,
+            model_progress=model_progress,
+            parallel_execution=True
+        )
+        running_scenarios.add(scenario_id)
 
         add_execution_log(scenario_id, "info",
                          f"Processing {total_steps} steps with {total_models} models IN PARALLEL",
                          {"models": MODELS_TO_EXECUTE, "total_steps": total_steps})
 
+        # Locate the immediate predecessor of the first step once, instead of
+        # every model task rescanning all steps (all_steps is pre-sorted)
+        prev_step: Optional[ScenarioStep] = None
+        if step_ids and steps_to_process:
+            first_number = steps_to_process[0].step_number
+            for s in all_steps:
+                if s.step_number >= first_number:
+                    break
+                prev_step = s
+
         # Execute all models in parallel, but steps within each model are sequential
         tasks = [
             execute_model_steps_sequential(
                 scenario_id=scenario_id,
                 model_name=model_name,
                 steps_to_process=steps_to_process,
-                all_steps=all_steps,
+                prev_step=prev_step,
                 system_prompt=system_prompt,
-                step_ids=step_ids,
                 model_progress=model_progress
             )
             for model_name in MODELS_TO_EXECUTE
@@ -493,22 +663,28 @@ async def execute_scenario_background(scenario_id: str, step_ids: Optional[List[
 
         # Check if cancelled
         if is_scenario_cancelled(scenario_id):
-            execution_status[scenario_id]["status"] = ExecutionStatus.CANCELLED
+            async with status_locks[scenario_id]:
+                execution_status[scenario_id].status = ExecutionStatus.CANCELLED
             add_execution_log(scenario_id, "warning", "Execution cancelled by user")
             logger.info(f"Scenario {scenario_id} execution cancelled")
             return
 
-        # Update final status
-        execution_status[scenario_id]["steps_processed"] = total_processed
-        execution_status[scenario_id]["steps_failed"] = total_failed
-        execution_status[scenario_id]["models_completed"] = models_completed
+        # Update final status (compound mutation, guarded by the scenario lock)
+        async with status_locks[scenario_id]:
+            state = execution_status[scenario_id]
+            state.steps_processed = total_processed
+            state.steps_failed = total_failed
+            state.models_completed = models_completed
+
+            if errors:
+                state.status = ExecutionStatus.FAILED
+                state.error = "; ".join(errors)
+            else:
+                state.status = ExecutionStatus.COMPLETED
 
         if errors:
-            execution_status[scenario_id]["status"] = ExecutionStatus.FAILED
-            execution_status[scenario_id]["error"] = "; ".join(errors)
             add_execution_log(scenario_id, "error", f"Execution failed with errors: {'; '.join(errors)}")
         else:
-            execution_status[scenario_id]["status"] = ExecutionStatus.COMPLETED
             add_execution_log(scenario_id, "success", "Scenario execution completed successfully (parallel)")
 
         logger.info(f"Scenario {scenario_id} parallel execution complete: {models_completed}/{total_models} models succeeded")
@@ -516,28 +692,28 @@ async def execute_scenario_background(scenario_id: str, step_ids: Optional[List[
     except Exception as e:
         logger.error(f"Error executing scenario {scenario_id}: {e}", exc_info=True)
         add_execution_log(scenario_id, "error", f"Execution failed: {str(e)}")
-        execution_status[scenario_id] = {
-            "status": ExecutionStatus.FAILED,
-            "error": str(e),
-            "current_model": execution_status.get(scenario_id, {}).get("current_model"),
-            "current_model_index": execution_status.get(scenario_id, {}).get("current_model_index", 0),
-            "total_models": execution_status.get(scenario_id, {}).get("total_models", 0),
-            "current_step": execution_status.get(scenario_id, {}).get("current_step", 0),
-            "total_steps": execution_status.get(scenario_id, {}).get("total_steps", 0)
-        }
+        state = execution_status.get(scenario_id)
+        if state is None:
+            state = ExecutionState()
+            execution_status[scenario_id] = state
+        state.status = ExecutionStatus.FAILED
+        state.error = str(e)
+    finally:
+        running_scenarios.discard(scenario_id)
 
 
 @router.post("/{scenario_id}/execute")
 async def execute_scenario(scenario_id: str, background_tasks: BackgroundTasks):
     """Start async execution of all steps in a scenario with all models"""
-    scenario = scenario_service.get_scenario(scenario_id)
+    scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
 
-    if scenario_id in execution_status and execution_status[scenario_id].get("status") == ExecutionStatus.RUNNING:
+    state = execution_status.get(scenario_id)
+    if state is not None and state.status == ExecutionStatus.RUNNING:
         return {
             "message": "Scenario execution already in progress",
-            "status": execution_status[scenario_id]
+            "status": state
         }
 
     steps_with_audio = len([s for s in scenario.steps if s.voice_file_path])
@@ -548,21 +724,15 @@ async def execute_scenario(scenario_id: str, background_tasks: BackgroundTasks):
             detail="No steps have audio files. Please upload audio recordings before executing."
         )
 
-    total_models = len(MODELS_TO_EXECUTE)
-    execution_status[scenario_id] = {
-        "status": ExecutionStatus.PENDING,
-        "current_model": MODELS_TO_EXECUTE[0] if MODELS_TO_EXECUTE else None,
-        "current_model_index": 0,
-        "total_models": total_models,
-        "current_step": 0,
-        "total_steps": steps_with_audio,
-        "steps_processed": 0,
-        "steps_skipped": len(scenario.steps) - steps_with_audio,
-        "steps_failed": 0,
-        "models_completed": 0
-    }
+    total_models = TOTAL_MODELS
+    execution_status[scenario_id] = ExecutionState(
+        current_model=FIRST_MODEL,
+        total_models=total_models,
+        total_steps=steps_with_audio,
+        steps_skipped=len(scenario.steps) - steps_with_audio
+    )
 
-    execution_logs[scenario_id] = []
+    execution_logs[scenario_id].clear()
     add_execution_log(scenario_id, "info", "Execution queued, starting soon...")
 
     background_tasks.add_task(execute_scenario_background, scenario_id)
@@ -578,19 +748,14 @@ async def execute_scenario(scenario_id: str, background_tasks: BackgroundTasks):
 @router.get("/{scenario_id}/execute/status")
 async def get_execution_status(scenario_id: str):
     """Get the current execution status of a scenario"""
-    scenario = scenario_service.get_scenario(scenario_id)
+    scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
 
-    status = execution_status.get(scenario_id, {
-        "status": ExecutionStatus.PENDING,
-        "current_model": None,
-        "current_model_index": 0,
-        "total_models": len(MODELS_TO_EXECUTE),
-        "current_step": 0,
-        "total_steps": 0,
-        "message": "No execution started"
-    })
+    status = execution_status.get(scenario_id) or ExecutionState(
+        total_models=TOTAL_MODELS,
+        message="No execution started"
+    )
 
     return {
         "scenario_id": scenario_id,
@@ -599,27 +764,42 @@ async def get_execution_status(scenario_id: str):
     }
 
 
+# scenario_id -> (write version, serialized comparison); comparisons only
+# change when a scenario is written, so cache hits skip both the metric
+# aggregation and the JSON encode. Bounded like the other per-scenario maps
+# so payloads for deleted or long-forgotten scenarios don't pile up forever.
+_comparison_cache: Dict[str, tuple] = BoundedScenarioDict()
+
+
 @router.get("/{scenario_id}/comparison")
 async def get_scenario_comparison(scenario_id: str):
     """Get comparison results for all models in a scenario"""
-    comparison = scenario_service.get_scenario_comparison(scenario_id)
+    version = scenario_service.get_scenario_version(scenario_id)
+    cached = _comparison_cache.get(scenario_id)
+    if cached and cached[0] == version:
+        return Response(content=cached[1], media_type="application/json")
+
+    comparison = await asyncio.to_thread(scenario_service.get_scenario_comparison, scenario_id)
     if not comparison:
         raise HTTPException(status_code=404, detail="Scenario not found")
-    return comparison
+
+    payload = orjson.dumps(comparison)
+    _comparison_cache[scenario_id] = (version, payload)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.post("/{scenario_id}/steps/{step_id}/generate-order")
 async def generate_order_for_step(scenario_id: str, step_id: str):
     """Generate simulated ground truth order for a step using AI"""
     try:
-        scenario = scenario_service.get_scenario(scenario_id)
+        scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
         if not scenario:
             raise HTTPException(status_code=404, detail="Scenario not found")
 
         current_step = None
         previous_steps = []
 
-        for step in sorted(scenario.steps, key=lambda s: s.step_number):
+        for step in scenario.steps_sorted:
             if step.step_id == step_id:
                 current_step = step
                 break
@@ -635,7 +815,8 @@ async def generate_order_for_step(scenario_id: str, step_id: str):
             previous_steps=previous_steps
         )
 
-        scenario_service.update_step(
+        await asyncio.to_thread(
+            scenario_service.update_step,
             scenario_id,
             step_id,
             UpdateStepRequest(
@@ -644,7 +825,7 @@ async def generate_order_for_step(scenario_id: str, step_id: str):
             )
         )
 
-        updated_scenario = scenario_service.get_scenario(scenario_id)
+        updated_scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
 
         return {
             "message": f"Generated transcription and {len(cart_items)} cart items",
@@ -663,18 +844,18 @@ async def generate_order_for_step(scenario_id: str, step_id: str):
 @router.post("/{scenario_id}/execute/cancel")
 async def cancel_scenario_execution(scenario_id: str):
     """Cancel a running scenario execution"""
-    scenario = scenario_service.get_scenario(scenario_id)
+    scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
 
-    current_status = execution_status.get(scenario_id, {})
-    if current_status.get("status") != ExecutionStatus.RUNNING:
+    current_status = execution_status.get(scenario_id)
+    if current_status is None or current_status.status != ExecutionStatus.RUNNING:
         return {
             "message": "Scenario is not currently running",
             "status": current_status
         }
 
-    cancelled_scenarios.add(scenario_id)
+    request_scenario_cancel(scenario_id)
     add_execution_log(scenario_id, "warning", "Cancellation requested by user")
 
     return {
@@ -686,38 +867,32 @@ async def cancel_scenario_execution(scenario_id: str):
 @router.post("/{scenario_id}/steps/{step_id}/execute")
 async def execute_single_step(scenario_id: str, step_id: str, background_tasks: BackgroundTasks):
     """Execute a single step (re-run) for all models"""
-    scenario = scenario_service.get_scenario(scenario_id)
+    scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
 
-    step = next((s for s in scenario.steps if s.step_id == step_id), None)
+    step = scenario.step_index.get(step_id)
     if not step:
         raise HTTPException(status_code=404, detail="Step not found")
 
     if not step.voice_file_path:
         raise HTTPException(status_code=400, detail="Step has no audio file")
 
-    if scenario_id in execution_status and execution_status[scenario_id].get("status") == ExecutionStatus.RUNNING:
+    state = execution_status.get(scenario_id)
+    if state is not None and state.status == ExecutionStatus.RUNNING:
         return {
             "message": "Scenario execution already in progress",
-            "status": execution_status[scenario_id]
+            "status": state
         }
 
-    total_models = len(MODELS_TO_EXECUTE)
-    execution_status[scenario_id] = {
-        "status": ExecutionStatus.PENDING,
-        "current_model": MODELS_TO_EXECUTE[0] if MODELS_TO_EXECUTE else None,
-        "current_model_index": 0,
-        "total_models": total_models,
-        "current_step": 0,
-        "total_steps": 1,
-        "steps_processed": 0,
-        "steps_skipped": 0,
-        "steps_failed": 0,
-        "models_completed": 0,
-        "is_single_step": True,
-        "step_id": step_id
-    }
+    total_models = TOTAL_MODELS
+    execution_status[scenario_id] = ExecutionState(
+        current_model=FIRST_MODEL,
+        total_models=total_models,
+        total_steps=1,
+        is_single_step=True,
+        step_id=step_id
+    )
 
     background_tasks.add_task(execute_scenario_background, scenario_id, [step_id])
 
@@ -733,51 +908,89 @@ async def execute_single_step(scenario_id: str, step_id: str, background_tasks:
 @router.get("/{scenario_id}/execute/logs")
 async def get_execution_logs(scenario_id: str, limit: int = 50):
     """Get execution logs for a scenario"""
-    scenario = scenario_service.get_scenario(scenario_id)
+    scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
 
-    logs = execution_logs.get(scenario_id, [])
+    # Snapshot the deque so concurrent appends don't mutate mid-serialization
+    logs = list(execution_logs.get(scenario_id, ()))
     return {
         "scenario_id": scenario_id,
-        "logs": logs[-limit:] if limit else logs,
+        "logs": format_execution_logs(logs[-limit:] if limit else logs),
         "total_logs": len(logs)
     }
 
 
 @router.get("/{scenario_id}/execute/logs/stream")
 async def stream_execution_logs(scenario_id: str):
-    """Get execution logs with current status for a scenario"""
-    scenario = scenario_service.get_scenario(scenario_id)
+    """Stream execution logs as server-sent events.
+
+    Replays the buffered logs, then pushes each new entry as it is appended,
+    so clients pay one encode per log line instead of one full snapshot
+    serialization per poll.
+    """
+    scenario = await asyncio.to_thread(scenario_service.get_scenario, scenario_id)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
 
-    logs = execution_logs.get(scenario_id, [])
-    status = execution_status.get(scenario_id, {})
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
 
-    return {
-        "scenario_id": scenario_id,
-        "logs": logs,
-        "total_logs": len(logs),
-        "execution_status": status,
-        "all_scenario_ids_with_logs": list(execution_logs.keys())
-    }
+    async def event_generator():
+        # Snapshot, then subscribe, with no await in between: anything
+        # appended after this point arrives only via the queue, so replayed
+        # entries can't be pushed a second time while the replay yields
+        replay = list(execution_logs.get(scenario_id, ()))
+        log_subscribers[scenario_id].append(queue)
+        try:
+            for entry in format_execution_logs(replay):
+                yield b"data: " + orjson.dumps(entry) + b"\n\n"
+            while True:
+                record = await queue.get()
+                yield b"data: " + orjson.dumps(format_execution_logs([record])[0]) + b"\n\n"
+        except asyncio.CancelledError:
+            # Client disconnected; fall through to unsubscribe
+            raise
+        finally:
+            # The subscriber list may have been evicted from the bounded map
+            # mid-stream; indexing would hand back a fresh list and remove
+            # would raise ValueError
+            subscribers = log_subscribers.get(scenario_id)
+            if subscribers and queue in subscribers:
+                subscribers.remove(queue)
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 
 async def process_execution_queue():
-    """Process scenarios in the execution queue one by one"""
-    global batch_execution_running
+    """Process queued scenarios concurrently, bounded by BATCH_CONCURRENCY.
 
-    while execution_queue:
-        queued = execution_queue.popleft()
-        scenario_id = queued.scenario_id
+    Scenario executions are I/O bound (LLM calls), so running a few at once
+    overlaps their provider waits: wall time approaches the slowest scenario
+    instead of the sum of all of them.
+    """
+    global batch_execution_running
 
-        if scenario_id in cancelled_scenarios:
-            cancelled_scenarios.discard(scenario_id)
-            continue
+    semaphore = asyncio.Semaphore(int(os.getenv("BATCH_CONCURRENCY", "4")))
+
+    async def run_one(scenario_id: str):
+        async with semaphore:
+            # Entries stay in execution_queue until their slot comes up, so
+            # batch cancel (which clears the queue) and queue removal still
+            # apply to scenarios that haven't started yet
+            async with queue_lock:
+                queued = execution_queue.pop(scenario_id, None)
+            if queued is None:
+                return
+            if is_scenario_cancelled(scenario_id):
+                clear_scenario_cancel(scenario_id)
+                return
+            logger.info(f"Processing queued scenario: {queued.scenario_name}")
+            await execute_scenario_background(scenario_id)
 
-        logger.info(f"Processing queued scenario: {queued.scenario_name}")
-        await execute_scenario_background(scenario_id)
+    # Keep draining: new scenarios may be enqueued while a batch is running
+    while execution_queue:
+        batch_ids = list(execution_queue.keys())
+        await asyncio.gather(*(run_one(scenario_id) for scenario_id in batch_ids))
 
     batch_execution_running = False
     logger.info("Batch execution queue completed")
@@ -794,43 +1007,50 @@ async def batch_execute_scenarios(
     added = []
     skipped = []
 
+    # One bulk fetch instead of a storage round-trip per id, run off the
+    # event loop so concurrent requests aren't stalled behind it
+    scenarios_by_id = await asyncio.to_thread(
+        scenario_service.get_scenarios_bulk, scenario_ids
+    )
+
+    # Queue-independent validation first; the queue mutation itself happens
+    # atomically under the queue lock afterwards
+    validated = []
     for scenario_id in scenario_ids:
-        scenario = scenario_service.get_scenario(scenario_id)
+        scenario = scenarios_by_id.get(scenario_id)
         if not scenario:
             skipped.append({"scenario_id": scenario_id, "reason": "Not found"})
             continue
-
-        steps_with_audio = len([s for s in scenario.steps if s.voice_file_path])
-        if steps_with_audio == 0:
+        if scenario.steps_with_audio == 0:
             skipped.append({"scenario_id": scenario_id, "reason": "No audio files"})
             continue
+        validated.append((scenario_id, scenario))
 
-        already_queued = any(q.scenario_id == scenario_id for q in execution_queue)
-        currently_running = execution_status.get(scenario_id, {}).get("status") == ExecutionStatus.RUNNING
+    async with queue_lock:
+        for scenario_id, scenario in validated:
+            already_queued = scenario_id in execution_queue
+            state = execution_status.get(scenario_id)
+            currently_running = state is not None and state.status == ExecutionStatus.RUNNING
 
-        if already_queued or currently_running:
-            skipped.append({"scenario_id": scenario_id, "reason": "Already queued or running"})
-            continue
+            if already_queued or currently_running:
+                skipped.append({"scenario_id": scenario_id, "reason": "Already queued or running"})
+                continue
 
-        execution_queue.append(QueuedScenario(
-            scenario_id=scenario_id,
-            scenario_name=scenario.name,
-            queued_at=datetime.now().isoformat(),
-            priority=0
-        ))
-
-        execution_status[scenario_id] = {
-            "status": ExecutionStatus.PENDING,
-            "current_model": None,
-            "current_model_index": 0,
-            "total_models": len(MODELS_TO_EXECUTE),
-            "current_step": 0,
-            "total_steps": steps_with_audio,
-            "queued": True,
-            "queue_position": len(execution_queue)
-        }
+            execution_queue[scenario_id] = QueuedScenario(
+                scenario_id=scenario_id,
+                scenario_name=scenario.name,
+                queued_at=time.time(),
+                priority=0
+            )
+
+            execution_status[scenario_id] = ExecutionState(
+                total_models=TOTAL_MODELS,
+                total_steps=scenario.steps_with_audio,
+                queued=True,
+                queue_position=len(execution_queue)
+            )
 
-        added.append({"scenario_id": scenario_id, "name": scenario.name})
+            added.append({"scenario_id": scenario_id, "name": scenario.name})
 
     if not batch_execution_running and execution_queue:
         batch_execution_running = True
@@ -847,20 +1067,13 @@ async def batch_execute_scenarios(
 @router.get("/batch/queue")
 async def get_execution_queue():
     """Get current execution queue status"""
-    currently_executing = None
-    for sid, status in execution_status.items():
-        if status.get("status") == ExecutionStatus.RUNNING:
-            scenario = scenario_service.get_scenario(sid)
-            currently_executing = {
-                "scenario_id": sid,
-                "scenario_name": scenario.name if scenario else "Unknown",
-                "status": status
-            }
-            break
+    # O(1) read of the running set instead of scanning every status entry
+    # accumulated over the process lifetime
+    currently_executing = next(iter(running_scenarios), None)
 
     return ExecutionQueueStatus(
-        queue=list(execution_queue),
-        currently_executing=currently_executing["scenario_id"] if currently_executing else None,
+        queue=list(execution_queue.values()),
+        currently_executing=currently_executing,
         is_batch_running=batch_execution_running
     )
 
@@ -868,16 +1081,12 @@ async def get_execution_queue():
 @router.post("/batch/queue/remove/{scenario_id}")
 async def remove_from_queue(scenario_id: str):
     """Remove a scenario from the execution queue"""
-    global execution_queue
-
-    original_len = len(execution_queue)
-    execution_queue = deque(q for q in execution_queue if q.scenario_id != scenario_id)
+    async with queue_lock:
+        if execution_queue.pop(scenario_id, None) is None:
+            raise HTTPException(status_code=404, detail="Scenario not in queue")
 
-    if len(execution_queue) == original_len:
-        raise HTTPException(status_code=404, detail="Scenario not in queue")
-
-    if scenario_id in execution_status:
-        del execution_status[scenario_id]
+        if scenario_id in execution_status:
+            del execution_status[scenario_id]
 
     return {
         "message": "Scenario removed from queue",
@@ -891,25 +1100,25 @@ async def reorder_queue(scenario_ids: List[str]):
     """Reorder the execution queue"""
     global execution_queue
 
-    new_queue = deque()
-    remaining = {q.scenario_id: q for q in execution_queue}
-
-    for sid in scenario_ids:
-        if sid in remaining:
-            new_queue.append(remaining.pop(sid))
-
-    for q in remaining.values():
-        new_queue.append(q)
-
-    execution_queue = new_queue
+    async with queue_lock:
+        new_queue = {
+            sid: execution_queue.pop(sid)
+            for sid in scenario_ids if sid in execution_queue
+        }
+        # Anything not mentioned keeps its relative order at the tail
+        new_queue.update(execution_queue)
+        execution_queue = new_queue
 
-    for idx, q in enumerate(execution_queue):
-        if q.scenario_id in execution_status:
-            execution_status[q.scenario_id]["queue_position"] = idx + 1
+        # Only touch positions that actually moved; a typical reorder shifts
+        # a handful of entries, not the whole queue
+        for idx, q in enumerate(execution_queue.values(), 1):
+            state = execution_status.get(q.scenario_id)
+            if state is not None and state.queue_position != idx:
+                state.queue_position = idx
 
     return {
         "message": "Queue reordered",
-        "queue": list(execution_queue)
+        "queue": list(execution_queue.values())
     }
 
 
@@ -918,16 +1127,17 @@ async def cancel_batch_execution():
     """Cancel all queued and running executions"""
     global batch_execution_running, execution_queue
 
-    cancelled_count = 0
-
-    for scenario_id, status in execution_status.items():
-        if status.get("status") == ExecutionStatus.RUNNING:
-            cancelled_scenarios.add(scenario_id)
-            cancelled_count += 1
-
-    queue_count = len(execution_queue)
-    execution_queue.clear()
-    batch_execution_running = False
+    # The running set keeps this O(#currently running) instead of a walk
+    # over every status entry accumulated since startup
+    running_now = list(running_scenarios)
+    for scenario_id in running_now:
+        request_scenario_cancel(scenario_id)
+    cancelled_count = len(running_now)
+
+    async with queue_lock:
+        queue_count = len(execution_queue)
+        execution_queue.clear()
+        batch_execution_running = False
 
     return {
         "message": f"Cancelled {cancelled_count} running and {queue_count} queued scenarios",
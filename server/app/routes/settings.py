@@ -3,11 +3,16 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from app.services.settings import settings_service, DEFAULT_SYSTEM_PROMPT
 from app.core.database import mongodb
-from app.core.prompt_builder import get_product_catalog_csv
+from app.core.prompt_builder import get_product_catalog_csv, get_catalog_version
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Debug payload cached against the catalog version: rebuilding it costs a
+# products query plus two passes over the full CSV, and the result only
+# changes when products are mutated
+_catalog_debug_cache = {"version": None, "payload": None}
+
 router = APIRouter(prefix="/api/settings", tags=["settings"])
 
 
@@ -53,6 +58,10 @@ async def reset_system_prompt():
 async def get_catalog_debug():
     """Debug endpoint to see what catalog data looks like"""
     try:
+        version = get_catalog_version()
+        if _catalog_debug_cache["version"] == version:
+            return _catalog_debug_cache["payload"]
+
         raw_products = []
         if mongodb.is_connected():
             collection = mongodb.get_collection("products")
@@ -62,14 +71,19 @@ async def get_catalog_debug():
                 raw_products.append(p)
 
         catalog_csv = get_product_catalog_csv()
-        catalog_lines = catalog_csv.split('\n')[:15]
+        # Split once: the sample needs only the head, the total only a count
+        catalog_lines = catalog_csv.split('\n', 15)[:15]
+        total_catalog_lines = catalog_csv.count('\n') + 1
 
-        return {
+        payload = {
             "mongodb_connected": mongodb.is_connected(),
             "raw_products_sample": raw_products,
             "catalog_csv_sample": catalog_lines,
-            "total_catalog_lines": len(catalog_csv.split('\n'))
+            "total_catalog_lines": total_catalog_lines
         }
+        _catalog_debug_cache["version"] = version
+        _catalog_debug_cache["payload"] = payload
+        return payload
     except Exception as e:
         logger.error(f"Error in catalog debug: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,20 +1,148 @@
 """AI Service for generating simulated ground truth orders for testing."""
 import vertexai
-from vertexai.generative_models import GenerativeModel
+from vertexai.caching import CachedContent
+from vertexai.generative_models import GenerativeModel, GenerationConfig
 from typing import List, Optional, Tuple
 from app.core.config import settings
-from app.models.scenario import CartItem, ScenarioStep
+from app.models.scenario import CartItem, CartItemListAdapter, ScenarioStep
 from app.core.database import mongodb
+import asyncio
+import datetime
 import logging
 import json
-import re
+import time
 
 logger = logging.getLogger(__name__)
 
+# Constrained decoding: the model can only emit tokens that satisfy this
+# schema, so responses are guaranteed parseable JSON with no prose or code
+# fences (and correspondingly fewer output tokens).
+ORDER_GENERATION_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "transcription": {
+            "type": "STRING",
+            "description": "Natural Greek speech of what the customer said"
+        },
+        "cart": {
+            "type": "ARRAY",
+            "description": "The complete cart state after this step",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "product_id": {"type": "STRING"},
+                    "product_name": {"type": "STRING"},
+                    "quantity": {"type": "INTEGER"},
+                    "unit": {"type": "STRING"}
+                },
+                "required": ["product_id", "product_name", "quantity", "unit"]
+            }
+        }
+    },
+    "required": ["transcription", "cart"]
+}
+
+ORDER_GENERATION_CONFIG = GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=ORDER_GENERATION_SCHEMA
+)
+
+# The order-generation catalog string changes only when products do, so it
+# is rebuilt at most once per TTL (or on explicit invalidation)
+CATALOG_TTL_SECONDS = 60.0
+
+# Nearly every product uses these units; the catalog legend declares them
+# once so per-product lines only spell units out when they differ, roughly
+# halving the catalog's token count
+DEFAULT_MAIN_UNIT = "ΤΕΜΑΧΙΟ"
+DEFAULT_SECONDARY_UNIT = "KOYTA"
+CATALOG_HEADER = (
+    f"LEGEND: columns are id<TAB>title<TAB>units_relation<TAB>main_unit<TAB>secondary_unit; "
+    f"when the unit columns are omitted the defaults apply: "
+    f"main_unit={DEFAULT_MAIN_UNIT}, secondary_unit={DEFAULT_SECONDARY_UNIT}"
+)
+
+# Server-side prompt cache lifetime. Recreated slightly before the Vertex
+# TTL so a call never references an expired cache resource.
+CONTEXT_CACHE_TTL_SECONDS = 3600.0
+CONTEXT_CACHE_REFRESH_MARGIN_SECONDS = 60.0
+# Back off this long before retrying if cache creation fails (e.g. the
+# model/region does not support explicit caching)
+CONTEXT_CACHE_RETRY_SECONDS = 300.0
+
+ORDER_GENERATION_MODEL = "gemini-2.5-flash"
+
+# Static preamble shared by every generate_order prompt; with explicit
+# context caching these tokens are uploaded once per cache TTL instead of
+# being re-sent (and re-billed at full rate) on every call.
+PROMPT_PREAMBLE_TEMPLATE = """You are generating test data for a voice ordering system for a Greek tobacco/convenience store.
+
+<product_catalog>
+{catalog}
+</product_catalog>
+"""
+
+# The instruction bodies below are invariant, so they are built once at
+# import instead of being re-spliced into a multi-KB f-string per call;
+# generate_order only concatenates the small dynamic head onto them.
+FIRST_STEP_PROMPT = """Generate a realistic initial order from a customer. The customer should order between 10 and 20 different products from the product catalog.
+
+Generate:
+1. A natural Greek transcription of what the customer would say when placing this order
+2. The cart items
+
+OUTPUT FORMAT (JSON only, no other text):
+{
+  "transcription": "The Greek text of what the customer said, e.g., Θέλω 3 κουτιά TEREA RUSSET, 5 κουτιά TEREA AMBER...",
+  "cart": [
+    {"product_id": "1", "product_name": "TEREA RUSSET", "quantity": 3, "unit": "KOYTA"},
+    {"product_id": "2", "product_name": "TEREA AMBER", "quantity": 5, "unit": "KOYTA"}
+  ]
+}
+
+Rules:
+- Use products from the catalog only
+- Quantities should be realistic (1-10 boxes typically)
+- Unit should be "KOYTA" (box/package) for most orders
+- The transcription should be natural Greek speech
+- Include 10-20 different products
+"""
+
+MODIFY_STEP_INSTRUCTIONS = """Generate a realistic modification to the order. The customer should do ONE of these:
+- Add 2-5 new products to the cart
+- Remove 1-3 products from the cart
+- Change quantities of 2-4 existing products
+- A combination of adding, removing, and changing quantities
+
+Generate:
+1. A natural Greek transcription of what the customer would say
+2. The COMPLETE cart after this modification (not just the changes)
+
+OUTPUT FORMAT (JSON only, no other text):
+{
+  "transcription": "The Greek text of what the customer said, e.g., Θέλω να προσθέσω 2 κουτιά TEREA SIENNA και να αφαιρέσω το TEREA AMBER",
+  "cart": [
+    {"product_id": "1", "product_name": "TEREA RUSSET", "quantity": 3, "unit": "KOYTA"},
+    {"product_id": "5", "product_name": "TEREA SIENNA", "quantity": 2, "unit": "KOYTA"}
+  ]
+}
+
+Rules:
+- The cart array should contain the COMPLETE cart state after modifications
+- Use products from the catalog only
+- The transcription should clearly indicate what changes the customer wants
+- Be realistic - customers often add forgotten items, remove items they changed their mind about, or adjust quantities
+"""
+
 
 class OrderGenerationService:
     def __init__(self):
         self.model = None
+        self._catalog_cache: Optional[Tuple[float, str]] = None
+        self._cached_content: Optional[CachedContent] = None
+        self._cached_model: Optional[GenerativeModel] = None
+        self._cached_model_expires = 0.0
+        self._cache_retry_after = 0.0
         self._initialize_model()
 
     def _initialize_model(self):
@@ -24,29 +152,124 @@ class OrderGenerationService:
                 project=settings.GCP_PROJECT_ID,
                 location=settings.GCP_LOCATION
             )
-            self.model = GenerativeModel("gemini-2.5-flash")
-            logger.info("Order generation service initialized with gemini-2.5-flash")
+            self.model = GenerativeModel(ORDER_GENERATION_MODEL)
+            logger.info(f"Order generation service initialized with {ORDER_GENERATION_MODEL}")
         except Exception as e:
             logger.error(f"Failed to initialize order generation model: {e}")
 
+    async def warmup(self):
+        """Force credential refresh and channel setup before the first request.
+
+        Without this the first generate_order pays the google-auth token
+        acquisition and connection handshake on the critical path.
+        """
+        if not self.model:
+            return
+        try:
+            await asyncio.to_thread(self.model.count_tokens, "ping")
+            logger.info("Warmed up order generation model")
+        except Exception as e:
+            logger.warning(f"Order generation warmup failed: {e}")
+
+    def invalidate_catalog(self):
+        """Force the next generate_order to rebuild the catalog string"""
+        self._catalog_cache = None
+        self._drop_context_cache()
+
+    def _drop_context_cache(self):
+        """Discard the server-side prompt cache (best effort)"""
+        cached_content = self._cached_content
+        self._cached_content = None
+        self._cached_model = None
+        self._cached_model_expires = 0.0
+        self._cache_retry_after = 0.0
+        if cached_content is not None:
+            try:
+                cached_content.delete()
+            except Exception as e:
+                logger.warning(f"Failed to delete context cache: {e}")
+
+    async def _get_generation_model(self, catalog: str) -> Tuple[GenerativeModel, bool]:
+        """Get the model to generate with, preferring a context-cached one.
+
+        The catalog preamble is thousands of tokens resent on every call;
+        referencing it through a Vertex cachedContents resource discounts
+        those input tokens and lowers time-to-first-token. Returns
+        (model, catalog_is_cached); on any caching failure the plain model
+        is returned and the catalog goes inline as before.
+        """
+        now = time.monotonic()
+        if self._cached_model is not None and now < self._cached_model_expires:
+            return self._cached_model, True
+        if now < self._cache_retry_after:
+            return self.model, False
+
+        try:
+            old_cache = self._cached_content
+            cached_content = await asyncio.to_thread(
+                CachedContent.create,
+                model_name=ORDER_GENERATION_MODEL,
+                contents=[PROMPT_PREAMBLE_TEMPLATE.format(catalog=catalog)],
+                ttl=datetime.timedelta(seconds=CONTEXT_CACHE_TTL_SECONDS)
+            )
+            self._cached_content = cached_content
+            self._cached_model = GenerativeModel.from_cached_content(cached_content=cached_content)
+            self._cached_model_expires = (
+                now + CONTEXT_CACHE_TTL_SECONDS - CONTEXT_CACHE_REFRESH_MARGIN_SECONDS
+            )
+            if old_cache is not None:
+                try:
+                    old_cache.delete()
+                except Exception:
+                    pass
+            logger.info("Created context cache for order generation preamble")
+            return self._cached_model, True
+        except Exception as e:
+            logger.warning(f"Context caching unavailable, sending catalog inline: {e}")
+            self._cached_model = None
+            self._cached_content = None
+            # Don't hammer the caching endpoint if it keeps failing
+            self._cache_retry_after = now + CONTEXT_CACHE_RETRY_SECONDS
+            return self.model, False
+
     def _get_product_catalog(self) -> str:
-        """Get the product catalog as a formatted string"""
+        """Get the product catalog as a formatted string (cached with TTL)"""
+        cached = self._catalog_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
         try:
             if mongodb.is_connected():
                 collection = mongodb.get_collection("products")
-                products = list(collection.find())
-
-                catalog_lines = ["ID,Title,Units Relation,Main Unit,Secondary Unit"]
+                # Only the rendered fields cross the wire
+                projection = {
+                    "_id": 0,
+                    "product_id": 1,
+                    "id": 1,
+                    "title": 1,
+                    "units_relation": 1,
+                    "main_unit_description": 1,
+                    "secondary_unit_description": 1
+                }
+                products = list(collection.find({}, projection))
+
+                catalog_lines = [CATALOG_HEADER]
                 for p in products:
-                    p.pop('_id', None)
                     product_id = p.get('product_id', p.get('id', ''))
                     title = p.get('title', '')
                     units_relation = p.get('units_relation', 10)
-                    main_unit = p.get('main_unit_description', 'ΤΕΜΑΧΙΟ')
-                    secondary_unit = p.get('secondary_unit_description', 'KOYTA')
-                    catalog_lines.append(f"{product_id},{title},{units_relation},{main_unit},{secondary_unit}")
-
-                return "\n".join(catalog_lines)
+                    main_unit = p.get('main_unit_description', DEFAULT_MAIN_UNIT)
+                    secondary_unit = p.get('secondary_unit_description', DEFAULT_SECONDARY_UNIT)
+                    # Default-unit rows (the vast majority) drop the unit
+                    # columns entirely; the legend supplies them
+                    if main_unit == DEFAULT_MAIN_UNIT and secondary_unit == DEFAULT_SECONDARY_UNIT:
+                        catalog_lines.append(f"{product_id}\t{title}\t{units_relation}")
+                    else:
+                        catalog_lines.append(f"{product_id}\t{title}\t{units_relation}\t{main_unit}\t{secondary_unit}")
+
+                catalog = "\n".join(catalog_lines)
+                self._catalog_cache = (time.monotonic() + CATALOG_TTL_SECONDS, catalog)
+                return catalog
             else:
                 logger.warning("MongoDB not connected, using empty catalog")
                 return "No products available"
@@ -62,8 +285,15 @@ class OrderGenerationService:
         if not previous_steps:
             return ""
 
+        # Callers collect these from scenario.steps_sorted, so they arrive
+        # ordered; the O(n) monotonicity check skips the wasted re-sort and
+        # still handles an unordered caller correctly
+        if any(previous_steps[i].step_number > previous_steps[i + 1].step_number
+               for i in range(len(previous_steps) - 1)):
+            previous_steps = sorted(previous_steps, key=lambda s: s.step_number)
+
         context_parts = ["Previous steps in the conversation:"]
-        for step in sorted(previous_steps, key=lambda s: s.step_number):
+        for step in previous_steps:
             context_parts.append(f"\n--- Step {step.step_number} ---")
             context_parts.append(f"Customer said: {step.voice_text or 'No transcription'}")
 
@@ -89,83 +319,46 @@ class OrderGenerationService:
             raise ValueError("Order generation model not initialized")
 
         try:
-            catalog = self._get_product_catalog()
+            # Cache misses hit Mongo; run them off the event loop
+            catalog = await asyncio.to_thread(self._get_product_catalog)
             context = self._build_context_from_previous_steps(previous_steps or [])
 
             is_first_step = step_number == 1 or not previous_steps or len(previous_steps) == 0
 
-            if is_first_step:
-                prompt = f"""You are generating test data for a voice ordering system for a Greek tobacco/convenience store.
-
-Generate a realistic initial order from a customer. The customer should order between 10 and 20 different products from the catalog below.
-
-<product_catalog>
-{catalog}
-</product_catalog>
-
-Generate:
-1. A natural Greek transcription of what the customer would say when placing this order
-2. The cart items
-
-OUTPUT FORMAT (JSON only, no other text):
-{{
-  "transcription": "The Greek text of what the customer said, e.g., Θέλω 3 κουτιά TEREA RUSSET, 5 κουτιά TEREA AMBER...",
-  "cart": [
-    {{"product_id": "1", "product_name": "TEREA RUSSET", "quantity": 3, "unit": "KOYTA"}},
-    {{"product_id": "2", "product_name": "TEREA AMBER", "quantity": 5, "unit": "KOYTA"}}
-  ]
-}}
+            model, catalog_is_cached = await self._get_generation_model(catalog)
+            # When the preamble lives in the server-side cache only the
+            # dynamic tail is sent; otherwise prepend it inline as before
+            static_prefix = "" if catalog_is_cached else PROMPT_PREAMBLE_TEMPLATE.format(catalog=catalog) + "\n"
 
-Rules:
-- Use products from the catalog only
-- Quantities should be realistic (1-10 boxes typically)
-- Unit should be "KOYTA" (box/package) for most orders
-- The transcription should be natural Greek speech
-- Include 10-20 different products
-"""
+            if is_first_step:
+                prompt = static_prefix + FIRST_STEP_PROMPT
             else:
-                prompt = f"""You are generating test data for a voice ordering system for a Greek tobacco/convenience store.
-
-This is step {step_number} of a multi-step ordering conversation. The customer already has items in their cart and now wants to MODIFY their order.
-
-<product_catalog>
-{catalog}
-</product_catalog>
-
-<previous_conversation>
-{context}
-</previous_conversation>
-
-Generate a realistic modification to the order. The customer should do ONE of these:
-- Add 2-5 new products to the cart
-- Remove 1-3 products from the cart
-- Change quantities of 2-4 existing products
-- A combination of adding, removing, and changing quantities
-
-Generate:
-1. A natural Greek transcription of what the customer would say
-2. The COMPLETE cart after this modification (not just the changes)
-
-OUTPUT FORMAT (JSON only, no other text):
-{{
-  "transcription": "The Greek text of what the customer said, e.g., Θέλω να προσθέσω 2 κουτιά TEREA SIENNA και να αφαιρέσω το TEREA AMBER",
-  "cart": [
-    {{"product_id": "1", "product_name": "TEREA RUSSET", "quantity": 3, "unit": "KOYTA"}},
-    {{"product_id": "5", "product_name": "TEREA SIENNA", "quantity": 2, "unit": "KOYTA"}}
-  ]
-}}
-
-Rules:
-- The cart array should contain the COMPLETE cart state after modifications
-- Use products from the catalog only
-- The transcription should clearly indicate what changes the customer wants
-- Be realistic - customers often add forgotten items, remove items they changed their mind about, or adjust quantities
-"""
+                prompt = (
+                    f"{static_prefix}This is step {step_number} of a multi-step ordering conversation. "
+                    "The customer already has items in their cart and now wants to MODIFY their order.\n\n"
+                    f"<previous_conversation>\n{context}\n</previous_conversation>\n\n"
+                    + MODIFY_STEP_INSTRUCTIONS
+                )
 
             logger.info(f"Generating order for step {step_number}, is_first_step={is_first_step}")
 
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
+            # Streamed call: chunks are drained as Vertex emits them instead
+            # of buffering the whole response upstream, so completion lands
+            # as soon as the last token does and the loop stays free between
+            # chunks for every other in-flight request
+            stream = await model.generate_content_async(
+                prompt,
+                generation_config=ORDER_GENERATION_CONFIG,
+                stream=True
+            )
+            chunks = []
+            async for chunk in stream:
+                try:
+                    chunks.append(chunk.text)
+                except ValueError:
+                    # Safety/finish chunks carry no text parts
+                    continue
+            response_text = "".join(chunks).strip()
 
             logger.info(f"Raw order generation response: {response_text[:500]}...")
 
@@ -183,12 +376,8 @@ Rules:
     def _parse_response(self, response_text: str) -> Tuple[str, List[CartItem]]:
         """Parse the LLM response into transcription and CartItem objects"""
         try:
-            json_match = re.search(r'\{[\s\S]*\}', response_text)
-            if json_match:
-                json_str = json_match.group()
-                data = json.loads(json_str)
-            else:
-                data = json.loads(response_text)
+            # Schema-constrained decoding guarantees a bare JSON object
+            data = json.loads(response_text)
 
             if not isinstance(data, dict):
                 logger.warning(f"Expected dict, got {type(data)}")
@@ -199,14 +388,17 @@ Rules:
 
             cart_items = []
             if isinstance(cart_data, list):
-                for item in cart_data:
-                    if isinstance(item, dict):
-                        cart_items.append(CartItem(
-                            product_id=str(item.get('product_id', '')),
-                            product_name=item.get('product_name', ''),
-                            quantity=int(item.get('quantity', 0)),
-                            unit=item.get('unit', 'KOYTA')
-                        ))
+                # Normalize fields then bulk-validate the whole list at once
+                normalized = [
+                    {
+                        "product_id": str(item.get('product_id', '')),
+                        "product_name": item.get('product_name', ''),
+                        "quantity": int(item.get('quantity', 0)),
+                        "unit": item.get('unit', 'KOYTA')
+                    }
+                    for item in cart_data if isinstance(item, dict)
+                ]
+                cart_items = CartItemListAdapter.validate_python(normalized)
 
             return transcription, cart_items
 
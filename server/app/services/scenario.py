@@ -6,25 +6,71 @@ from app.models.scenario import (
     UpdateStepModelResultRequest, MODELS_TO_EXECUTE
 )
 from app.core.database import mongodb
+from app.core.raw_response_store import raw_response_store
 from app.services.settings import settings_service
 import uuid
+import threading
+import time
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# The UI polls status/log endpoints every second and each poll re-fetched and
+# re-validated the full scenario document; a short TTL keeps reads fresh
+# enough while absorbing the polling traffic.
+SCENARIO_CACHE_TTL_SECONDS = 5.0
+# Upper bound on cached scenarios so a long-lived process can't accumulate
+# every scenario it has ever served
+MAX_CACHED_SCENARIOS = 512
+
+# Per-model accumulator template for get_scenario_comparison; a shallow
+# .copy() is cheaper than re-evaluating the 9-key dict literal per model
+# on every comparison call
+_ZERO_SUMMARY = {
+    "total_precision": 0.0,
+    "total_recall": 0.0,
+    "total_f1": 0.0,
+    "exact_matches": 0,
+    "total_steps": 0,
+    "total_input_tokens": 0,
+    "total_output_tokens": 0,
+    "total_latency_ms": 0,
+    "total_cost": 0.0
+}
+
 
 class ScenarioService:
     def __init__(self):
         self.collection_name = "scenarios"
         self.scenarios: Dict[str, Scenario] = {}
         self.use_mongodb = mongodb.is_connected()
+        # scenario_id -> (expires_at, Scenario); guarded for thread-pool access
+        self._scenario_cache: Dict[str, tuple] = {}
+        # (expires_at, scenarios) snapshot for list_scenarios, invalidated
+        # alongside the per-scenario cache on any write
+        self._list_cache: Optional[tuple] = None
+        self._cache_lock = threading.Lock()
+        # Monotonic per-scenario write counters; lets callers detect staleness
+        # of anything they derived from a scenario without re-reading it
+        self._scenario_versions: Dict[str, int] = {}
 
         if self.use_mongodb:
+            self._ensure_indexes()
             logger.info("Using MongoDB for scenario storage")
         else:
             logger.warning("Using in-memory storage for scenarios")
 
+    def _ensure_indexes(self):
+        """Create the lookup indexes; without them every query is a COLLSCAN"""
+        try:
+            collection = mongodb.get_collection(self.collection_name)
+            collection.create_index("scenario_id", unique=True)
+            # Step mutators match on the embedded step id as well
+            collection.create_index("steps.step_id")
+        except Exception as e:
+            logger.warning(f"Failed to create scenario indexes: {e}")
+
     def create_scenario(self, request: CreateScenarioRequest) -> Scenario:
         """Create a new scenario with specified number of steps"""
         scenario_id = str(uuid.uuid4())
@@ -50,34 +96,158 @@ class ScenarioService:
 
         if self.use_mongodb:
             collection = mongodb.get_collection(self.collection_name)
-            collection.insert_one(scenario.model_dump(mode='json'))
+            # Native-mode dump: pymongo encodes datetimes directly and
+            # exclude_none drops the many unset optional step fields
+            collection.insert_one(scenario.model_dump(mode='python', exclude_none=True))
         else:
             self.scenarios[scenario_id] = scenario
 
+        self.invalidate_scenario_cache(scenario_id)
         logger.info(f"Created scenario {scenario_id} with {request.num_steps} steps")
         return scenario
 
+    def invalidate_scenario_cache(self, scenario_id: Optional[str] = None):
+        """Drop cached scenario(s) after a write so reads see fresh data"""
+        with self._cache_lock:
+            self._list_cache = None
+            if scenario_id is None:
+                self._scenario_cache.clear()
+            else:
+                self._scenario_cache.pop(scenario_id, None)
+                self._scenario_versions[scenario_id] = (
+                    self._scenario_versions.get(scenario_id, 0) + 1
+                )
+
+    def _cache_store(self, scenarios: List[Scenario]):
+        """Insert scenarios into the TTL cache, evicting past the size cap.
+
+        The cache keeps private deep copies and readers get deep copies back:
+        mutators (update_step_model_result during execution, update_scenario,
+        ...) edit whatever get_scenario returned in place from worker threads,
+        and sharing one instance with concurrently serializing pollers lets a
+        dict resize mid-iteration blow up pydantic, or exposes half-applied
+        updates.
+        """
+        with self._cache_lock:
+            now = time.monotonic()
+            if len(self._scenario_cache) + len(scenarios) > MAX_CACHED_SCENARIOS:
+                for sid in [
+                    sid for sid, entry in self._scenario_cache.items()
+                    if entry[0] <= now
+                ]:
+                    del self._scenario_cache[sid]
+            while len(self._scenario_cache) + len(scenarios) > MAX_CACHED_SCENARIOS and self._scenario_cache:
+                self._scenario_cache.pop(next(iter(self._scenario_cache)))
+
+            expires = now + SCENARIO_CACHE_TTL_SECONDS
+            for scenario in scenarios:
+                self._scenario_cache[scenario.scenario_id] = (
+                    expires, scenario.model_copy(deep=True)
+                )
+
+    def get_scenario_version(self, scenario_id: str) -> int:
+        """Current write-version of a scenario (bumped on every mutation)"""
+        with self._cache_lock:
+            return self._scenario_versions.get(scenario_id, 0)
+
+    def _hydrate_raw_responses(self, scenario: Scenario):
+        """Re-attach stored raw responses to a scenario loaded from MongoDB"""
+        stored = raw_response_store.get_for_scenario(scenario.scenario_id)
+        if not stored:
+            return
+        for step in scenario.steps:
+            for model_name, result in step.model_results.items():
+                if result.raw_llm_response is None:
+                    result.raw_llm_response = stored.get((step.step_id, model_name))
+
     def get_scenario(self, scenario_id: str) -> Optional[Scenario]:
-        """Get a scenario by ID"""
+        """Get a scenario by ID (cached for a few seconds to absorb polling)"""
         if self.use_mongodb:
+            with self._cache_lock:
+                entry = self._scenario_cache.get(scenario_id)
+                if entry and entry[0] > time.monotonic():
+                    # Copy out: callers mutate the returned scenario in place
+                    return entry[1].model_copy(deep=True)
+
             collection = mongodb.get_collection(self.collection_name)
             doc = collection.find_one({"scenario_id": scenario_id})
             if doc:
                 doc.pop('_id', None)
                 scenario = Scenario.model_validate(doc)
+                self._hydrate_raw_responses(scenario)
+                self._cache_store([scenario])
                 return scenario
             return None
         else:
             return self.scenarios.get(scenario_id)
 
+    def get_scenarios_bulk(self, scenario_ids: List[str]) -> Dict[str, Scenario]:
+        """Fetch several scenarios in one query, keyed by scenario_id.
+
+        Collapses the N storage round-trips of calling get_scenario in a loop
+        into a single $in query for whatever the TTL cache doesn't cover.
+        """
+        if not scenario_ids:
+            return {}
+
+        if not self.use_mongodb:
+            return {
+                sid: self.scenarios[sid]
+                for sid in scenario_ids if sid in self.scenarios
+            }
+
+        unique_ids = list(dict.fromkeys(scenario_ids))
+        found: Dict[str, Scenario] = {}
+        missing: List[str] = []
+        with self._cache_lock:
+            now = time.monotonic()
+            for sid in unique_ids:
+                entry = self._scenario_cache.get(sid)
+                if entry and entry[0] > now:
+                    found[sid] = entry[1].model_copy(deep=True)
+                else:
+                    missing.append(sid)
+
+        if missing:
+            collection = mongodb.get_collection(self.collection_name)
+            fetched: List[Scenario] = []
+            for doc in collection.find({"scenario_id": {"$in": missing}}):
+                doc.pop('_id', None)
+                scenario = Scenario.model_validate(doc)
+                self._hydrate_raw_responses(scenario)
+                found[scenario.scenario_id] = scenario
+                fetched.append(scenario)
+            self._cache_store(fetched)
+
+        return found
+
     def list_scenarios(self) -> List[Scenario]:
-        """List all scenarios"""
+        """List all scenarios (cached briefly to absorb list-view polling)"""
         if self.use_mongodb:
+            with self._cache_lock:
+                entry = self._list_cache
+                if entry and entry[0] > time.monotonic():
+                    return entry[1]
+
             collection = mongodb.get_collection(self.collection_name)
             scenarios = []
-            for doc in collection.find():
-                doc.pop('_id', None)
+            # Raw responses are the heaviest field and the list view never
+            # renders them. voice_file_path must stay: the client opens the
+            # detail view directly from the list payload without refetching,
+            # and it gates the audio player and upload flows on that field.
+            # (Per-model raw responses are already nulled in storage.)
+            projection = {
+                "_id": 0,
+                "steps.raw_llm_response": 0
+            }
+            for doc in collection.find({}, projection):
                 scenarios.append(Scenario.model_validate(doc))
+
+            with self._cache_lock:
+                self._list_cache = (
+                    time.monotonic() + SCENARIO_CACHE_TTL_SECONDS,
+                    scenarios
+                )
             return scenarios
         else:
             return list(self.scenarios.values())
@@ -88,26 +258,34 @@ class ScenarioService:
         if not scenario:
             return None
 
+        changes: Dict[str, Any] = {}
         if request.name:
             scenario.name = request.name
+            changes["name"] = request.name
         if request.description is not None:
             scenario.description = request.description
+            changes["description"] = request.description
         if request.system_prompt is not None:
             scenario.system_prompt = request.system_prompt
+            changes["system_prompt"] = request.system_prompt
         if request.model_name is not None:
             scenario.model_name = request.model_name
+            changes["model_name"] = request.model_name
 
         scenario.updated_at = datetime.now()
 
         if self.use_mongodb:
+            # Only the touched fields transit, not the full nested document
+            changes["updated_at"] = scenario.updated_at
             collection = mongodb.get_collection(self.collection_name)
             collection.update_one(
                 {"scenario_id": scenario_id},
-                {"$set": scenario.model_dump(mode='json')}
+                {"$set": changes}
             )
         else:
             self.scenarios[scenario_id] = scenario
 
+        self.invalidate_scenario_cache(scenario_id)
         logger.info(f"Updated scenario {scenario_id}")
         return scenario
 
@@ -117,26 +295,41 @@ class ScenarioService:
             collection = mongodb.get_collection(self.collection_name)
             result = collection.delete_one({"scenario_id": scenario_id})
             if result.deleted_count > 0:
+                raw_response_store.delete_scenario(scenario_id)
+                self.invalidate_scenario_cache(scenario_id)
                 logger.info(f"Deleted scenario {scenario_id}")
                 return True
             return False
         else:
             if scenario_id in self.scenarios:
                 del self.scenarios[scenario_id]
+                raw_response_store.delete_scenario(scenario_id)
                 logger.info(f"Deleted scenario {scenario_id}")
                 return True
             return False
 
     def get_step(self, scenario_id: str, step_id: str) -> Optional[ScenarioStep]:
         """Get a specific step from a scenario"""
-        scenario = self.get_scenario(scenario_id)
-        if not scenario:
+        if not self.use_mongodb:
+            scenario = self.scenarios.get(scenario_id)
+            return scenario.step_index.get(step_id) if scenario else None
+
+        # A cached scenario answers for free; on a miss, a positional
+        # projection pulls and validates just the one step instead of the
+        # whole document with every other step and model result
+        with self._cache_lock:
+            entry = self._scenario_cache.get(scenario_id)
+            if entry and entry[0] > time.monotonic():
+                return entry[1].step_index.get(step_id)
+
+        collection = mongodb.get_collection(self.collection_name)
+        doc = collection.find_one(
+            {"scenario_id": scenario_id, "steps.step_id": step_id},
+            {"_id": 0, "steps.$": 1}
+        )
+        if not doc or not doc.get("steps"):
             return None
-
-        for step in scenario.steps:
-            if step.step_id == step_id:
-                return step
-        return None
+        return ScenarioStep.model_validate(doc["steps"][0])
 
     def update_step(self, scenario_id: str, step_id: str, request: UpdateStepRequest) -> Optional[ScenarioStep]:
         """Update a step in a scenario"""
@@ -144,43 +337,70 @@ class ScenarioService:
         if not scenario:
             return None
 
-        for step in scenario.steps:
-            if step.step_id == step_id:
-                if request.voice_text is not None:
-                    step.voice_text = request.voice_text
-                if request.llm_transcription is not None:
-                    step.llm_transcription = request.llm_transcription
-                if request.ai_response is not None:
-                    step.ai_response = request.ai_response
-                if request.raw_llm_response is not None:
-                    step.raw_llm_response = request.raw_llm_response
-                if request.ground_truth_cart is not None:
-                    step.ground_truth_cart = request.ground_truth_cart
-                if request.predicted_cart is not None:
-                    step.predicted_cart = request.predicted_cart
-                if request.input_tokens is not None:
-                    step.input_tokens = request.input_tokens
-                if request.output_tokens is not None:
-                    step.output_tokens = request.output_tokens
-                if request.latency_ms is not None:
-                    step.latency_ms = request.latency_ms
-
-                step.updated_at = datetime.now()
-                scenario.updated_at = datetime.now()
+        step = scenario.step_index.get(step_id)
+        if not step:
+            return None
 
-                if self.use_mongodb:
-                    collection = mongodb.get_collection(self.collection_name)
-                    collection.update_one(
-                        {"scenario_id": scenario_id},
-                        {"$set": scenario.model_dump(mode='json')}
-                    )
-                else:
-                    self.scenarios[scenario_id] = scenario
+        # Collect the touched fields in storage (JSON) form as they are
+        # applied, so the write below can address just those paths
+        changes: Dict[str, Any] = {}
+        if request.voice_file_path is not None:
+            step.voice_file_path = request.voice_file_path
+            changes["voice_file_path"] = request.voice_file_path
+            scenario.invalidate_step_caches()
+        if request.voice_text is not None:
+            step.voice_text = request.voice_text
+            changes["voice_text"] = request.voice_text
+        if request.llm_transcription is not None:
+            step.llm_transcription = request.llm_transcription
+            changes["llm_transcription"] = request.llm_transcription
+        if request.ai_response is not None:
+            step.ai_response = request.ai_response
+            changes["ai_response"] = request.ai_response
+        if request.raw_llm_response is not None:
+            step.raw_llm_response = request.raw_llm_response
+            changes["raw_llm_response"] = request.raw_llm_response
+        if request.ground_truth_cart is not None:
+            step.ground_truth_cart = request.ground_truth_cart
+            changes["ground_truth_cart"] = [
+                item.model_dump() for item in request.ground_truth_cart
+            ]
+        if request.predicted_cart is not None:
+            step.predicted_cart = request.predicted_cart
+            changes["predicted_cart"] = [
+                item.model_dump() for item in request.predicted_cart
+            ]
+        if request.input_tokens is not None:
+            step.input_tokens = request.input_tokens
+            changes["input_tokens"] = request.input_tokens
+        if request.output_tokens is not None:
+            step.output_tokens = request.output_tokens
+            changes["output_tokens"] = request.output_tokens
+        if request.latency_ms is not None:
+            step.latency_ms = request.latency_ms
+            changes["latency_ms"] = request.latency_ms
 
-                logger.info(f"Updated step {step_id} in scenario {scenario_id}")
-                return step
+        now = datetime.now()
+        step.updated_at = now
+        scenario.updated_at = now
 
-        return None
+        if self.use_mongodb:
+            # Positional update: only the touched step fields transit instead
+            # of rewriting the entire nested document
+            set_fields = {f"steps.$.{field}": value for field, value in changes.items()}
+            set_fields["steps.$.updated_at"] = now
+            set_fields["updated_at"] = now
+            collection = mongodb.get_collection(self.collection_name)
+            collection.update_one(
+                {"scenario_id": scenario_id, "steps.step_id": step_id},
+                {"$set": set_fields}
+            )
+        else:
+            self.scenarios[scenario_id] = scenario
+
+        self.invalidate_scenario_cache(scenario_id)
+        logger.info(f"Updated step {step_id} in scenario {scenario_id}")
+        return step
 
     def add_step(self, scenario_id: str, request: CreateStepRequest) -> Optional[ScenarioStep]:
         """Add a new step to a scenario"""
@@ -196,17 +416,27 @@ class ScenarioService:
 
         scenario.steps.append(step)
         scenario.steps.sort(key=lambda x: x.step_number)
+        scenario.invalidate_step_caches()
         scenario.updated_at = datetime.now()
 
         if self.use_mongodb:
+            # $push with $sort appends and reorders server-side; only the new
+            # step crosses the wire
             collection = mongodb.get_collection(self.collection_name)
             collection.update_one(
                 {"scenario_id": scenario_id},
-                {"$set": scenario.model_dump(mode='json')}
+                {
+                    "$push": {"steps": {
+                        "$each": [step.model_dump(mode='python', exclude_none=True)],
+                        "$sort": {"step_number": 1}
+                    }},
+                    "$set": {"updated_at": scenario.updated_at}
+                }
             )
         else:
             self.scenarios[scenario_id] = scenario
 
+        self.invalidate_scenario_cache(scenario_id)
         logger.info(f"Added step to scenario {scenario_id}")
         return step
 
@@ -219,17 +449,24 @@ class ScenarioService:
         for i, step in enumerate(scenario.steps):
             if step.step_id == step_id:
                 scenario.steps.pop(i)
+                scenario.invalidate_step_caches()
                 scenario.updated_at = datetime.now()
 
                 if self.use_mongodb:
+                    # $pull removes the step server-side without resending
+                    # the remaining ones
                     collection = mongodb.get_collection(self.collection_name)
                     collection.update_one(
                         {"scenario_id": scenario_id},
-                        {"$set": scenario.model_dump(mode='json')}
+                        {
+                            "$pull": {"steps": {"step_id": step_id}},
+                            "$set": {"updated_at": scenario.updated_at}
+                        }
                     )
                 else:
                     self.scenarios[scenario_id] = scenario
 
+                self.invalidate_scenario_cache(scenario_id)
                 logger.info(f"Deleted step {step_id} from scenario {scenario_id}")
                 return True
 
@@ -241,29 +478,59 @@ class ScenarioService:
         if not scenario:
             return None
 
-        for step in scenario.steps:
-            if step.step_id == step_id:
-                step.voice_file_path = file_path
-                step.updated_at = datetime.now()
-                scenario.updated_at = datetime.now()
+        step = scenario.step_index.get(step_id)
+        if not step:
+            return None
 
-                if self.use_mongodb:
-                    collection = mongodb.get_collection(self.collection_name)
-                    collection.update_one(
-                        {"scenario_id": scenario_id},
-                        {"$set": scenario.model_dump(mode='json')}
-                    )
-                else:
-                    self.scenarios[scenario_id] = scenario
+        step.voice_file_path = file_path
+        scenario.invalidate_step_caches()
+        now = datetime.now()
+        step.updated_at = now
+        scenario.updated_at = now
 
-                logger.info(f"Updated voice file for step {step_id}")
-                return step
+        if self.use_mongodb:
+            collection = mongodb.get_collection(self.collection_name)
+            collection.update_one(
+                {"scenario_id": scenario_id, "steps.step_id": step_id},
+                {"$set": {
+                    "steps.$.voice_file_path": file_path,
+                    "steps.$.updated_at": now,
+                    "updated_at": now
+                }}
+            )
+        else:
+            self.scenarios[scenario_id] = scenario
 
-        return None
+        self.invalidate_scenario_cache(scenario_id)
+        logger.info(f"Updated voice file for step {step_id}")
+        return step
 
     def clone_scenario(self, scenario_id: str, new_name: Optional[str] = None) -> Optional[Scenario]:
         """Clone/duplicate a scenario with all its steps"""
-        original = self.get_scenario(scenario_id)
+        if self.use_mongodb:
+            # Only the fields that survive a clone are fetched; execution
+            # results, raw responses and token stats are reset anyway, so
+            # there is no point pulling or hydrating them
+            collection = mongodb.get_collection(self.collection_name)
+            doc = collection.find_one(
+                {"scenario_id": scenario_id},
+                {
+                    "_id": 0,
+                    "scenario_id": 1,
+                    "name": 1,
+                    "description": 1,
+                    "system_prompt": 1,
+                    "model_name": 1,
+                    "steps.step_id": 1,
+                    "steps.step_number": 1,
+                    "steps.voice_file_path": 1,
+                    "steps.voice_text": 1,
+                    "steps.ground_truth_cart": 1
+                }
+            )
+            original = Scenario.model_validate(doc) if doc else None
+        else:
+            original = self.scenarios.get(scenario_id)
         if not original:
             return None
 
@@ -304,10 +571,11 @@ class ScenarioService:
 
         if self.use_mongodb:
             collection = mongodb.get_collection(self.collection_name)
-            collection.insert_one(cloned_scenario.model_dump(mode='json'))
+            collection.insert_one(cloned_scenario.model_dump(mode='python', exclude_none=True))
         else:
             self.scenarios[new_scenario_id] = cloned_scenario
 
+        self.invalidate_scenario_cache(new_scenario_id)
         logger.info(f"Cloned scenario {scenario_id} to {new_scenario_id}")
         return cloned_scenario
 
@@ -322,39 +590,56 @@ class ScenarioService:
         if not scenario:
             return None
 
-        for step in scenario.steps:
-            if step.step_id == step_id:
-                model_result = ModelExecutionResult(
-                    model_name=request.model_name,
-                    llm_transcription=request.llm_transcription,
-                    ai_response=request.ai_response,
-                    raw_llm_response=request.raw_llm_response,
-                    predicted_cart=request.predicted_cart,
-                    input_tokens=request.input_tokens,
-                    output_tokens=request.output_tokens,
-                    latency_ms=request.latency_ms,
-                    executed_at=datetime.now(),
-                    error=request.error
-                )
+        step = scenario.step_index.get(step_id)
+        if not step:
+            return None
 
-                step.model_results[request.model_name] = model_result
-                step.updated_at = datetime.now()
-                scenario.updated_at = datetime.now()
+        model_result = ModelExecutionResult(
+            model_name=request.model_name,
+            llm_transcription=request.llm_transcription,
+            ai_response=request.ai_response,
+            raw_llm_response=request.raw_llm_response,
+            predicted_cart=request.predicted_cart,
+            input_tokens=request.input_tokens,
+            output_tokens=request.output_tokens,
+            latency_ms=request.latency_ms,
+            executed_at=datetime.now(),
+            error=request.error
+        )
 
-                if self.use_mongodb:
-                    collection = mongodb.get_collection(self.collection_name)
-                    scenario_data = scenario.model_dump(mode='json')
-                    collection.update_one(
-                        {"scenario_id": scenario_id},
-                        {"$set": scenario_data}
-                    )
-                else:
-                    self.scenarios[scenario_id] = scenario
+        step.model_results[request.model_name] = model_result
+        now = datetime.now()
+        step.updated_at = now
+        scenario.updated_at = now
 
-                logger.info(f"Updated model result for {request.model_name} in step {step_id}")
-                return step
+        raw_response_store.put(
+            scenario_id, step_id, request.model_name, request.raw_llm_response
+        )
 
-        return None
+        if self.use_mongodb:
+            # Model names contain dots, so they can't be addressed inside an
+            # update path; setting the step's whole model_results map (a
+            # handful of entries) is still tiny next to the full document.
+            results_doc = {}
+            for name, result in step.model_results.items():
+                result_doc = result.model_dump(mode='python')
+                result_doc["raw_llm_response"] = None
+                results_doc[name] = result_doc
+            collection = mongodb.get_collection(self.collection_name)
+            collection.update_one(
+                {"scenario_id": scenario_id, "steps.step_id": step_id},
+                {"$set": {
+                    "steps.$.model_results": results_doc,
+                    "steps.$.updated_at": now,
+                    "updated_at": now
+                }}
+            )
+        else:
+            self.scenarios[scenario_id] = scenario
+
+        self.invalidate_scenario_cache(scenario_id)
+        logger.info(f"Updated model result for {request.model_name} in step {step_id}")
+        return step
 
     def clear_step_model_results(self, scenario_id: str) -> bool:
         """Clear all model execution results for a scenario"""
@@ -376,14 +661,30 @@ class ScenarioService:
         scenario.updated_at = datetime.now()
 
         if self.use_mongodb:
+            # $[] resets the result fields on every step server-side without
+            # resending the step array
+            now = scenario.updated_at
             collection = mongodb.get_collection(self.collection_name)
             collection.update_one(
                 {"scenario_id": scenario_id},
-                {"$set": scenario.model_dump(mode='json')}
+                {"$set": {
+                    "steps.$[].model_results": {},
+                    "steps.$[].llm_transcription": None,
+                    "steps.$[].ai_response": None,
+                    "steps.$[].raw_llm_response": None,
+                    "steps.$[].predicted_cart": None,
+                    "steps.$[].input_tokens": None,
+                    "steps.$[].output_tokens": None,
+                    "steps.$[].latency_ms": None,
+                    "steps.$[].updated_at": now,
+                    "updated_at": now
+                }}
             )
         else:
             self.scenarios[scenario_id] = scenario
 
+        raw_response_store.delete_scenario(scenario_id)
+        self.invalidate_scenario_cache(scenario_id)
         logger.info(f"Cleared all model results for scenario {scenario_id}")
         return True
 
@@ -402,32 +703,27 @@ class ScenarioService:
 
         correct_count = 0
         missing_items = []
-        extra_items = []
         quantity_mismatches = []
 
         for product_id, gt_item in gt_dict.items():
-            if product_id in pred_dict:
-                pred_item = pred_dict[product_id]
-
-                logger.debug(f"Comparing {product_id}: GT={gt_item.quantity} {gt_item.unit}, "
-                           f"Pred={pred_item.quantity} {pred_item.unit}")
-
-                if pred_item.quantity == gt_item.quantity:
-                    correct_count += 1
-                else:
-                    quantity_mismatches.append(QuantityMismatch(
-                        product_id=product_id,
-                        product_name=gt_item.product_name,
-                        expected_quantity=gt_item.quantity,
-                        actual_quantity=pred_item.quantity,
-                        unit=gt_item.unit
-                    ))
-            else:
+            pred_item = pred_dict.get(product_id)
+            if pred_item is None:
                 missing_items.append(gt_item)
-
-        for product_id, pred_item in pred_dict.items():
-            if product_id not in gt_dict:
-                extra_items.append(pred_item)
+            elif pred_item.quantity == gt_item.quantity:
+                correct_count += 1
+            else:
+                quantity_mismatches.append(QuantityMismatch(
+                    product_id=product_id,
+                    product_name=gt_item.product_name,
+                    expected_quantity=gt_item.quantity,
+                    actual_quantity=pred_item.quantity,
+                    unit=gt_item.unit
+                ))
+
+        # Single pass over pred_dict, preserving predicted-cart order (a set
+        # difference would come back in hash order, nondeterministic across
+        # processes)
+        extra_items = [item for pid, item in pred_dict.items() if pid not in gt_dict]
 
         total_gt = len(ground_truth)
         total_pred = len(predicted)
@@ -461,22 +757,15 @@ class ScenarioService:
             return None
 
         steps_comparison = []
+
+        # Running scalar sums per model, accumulated in the same sweep that
+        # builds the per-step comparisons; the whole aggregation is one pass
+        # over the steps with no intermediate arrays or second loop.
         model_summaries: Dict[str, Dict[str, Any]] = {
-            model: {
-                "total_precision": 0.0,
-                "total_recall": 0.0,
-                "total_f1": 0.0,
-                "exact_matches": 0,
-                "total_steps": 0,
-                "total_input_tokens": 0,
-                "total_output_tokens": 0,
-                "total_latency_ms": 0,
-                "total_cost": 0.0
-            }
-            for model in MODELS_TO_EXECUTE
+            model: _ZERO_SUMMARY.copy() for model in MODELS_TO_EXECUTE
         }
 
-        for step in sorted(scenario.steps, key=lambda s: s.step_number):
+        for step in scenario.steps_sorted:
             if not step.ground_truth_cart:
                 continue
 
@@ -493,14 +782,16 @@ class ScenarioService:
                 step_comparisons.append(comparison)
 
                 if model_result:
-                    model_summaries[model_name]["total_precision"] += comparison.precision
-                    model_summaries[model_name]["total_recall"] += comparison.recall
-                    model_summaries[model_name]["total_f1"] += comparison.f1_score
-                    model_summaries[model_name]["exact_matches"] += 1 if comparison.exact_match else 0
-                    model_summaries[model_name]["total_steps"] += 1
-                    model_summaries[model_name]["total_input_tokens"] += model_result.input_tokens or 0
-                    model_summaries[model_name]["total_output_tokens"] += model_result.output_tokens or 0
-                    model_summaries[model_name]["total_latency_ms"] += model_result.latency_ms or 0
+                    summary = model_summaries[model_name]
+                    summary["total_precision"] += comparison.precision
+                    summary["total_recall"] += comparison.recall
+                    summary["total_f1"] += comparison.f1_score
+                    if comparison.exact_match:
+                        summary["exact_matches"] += 1
+                    summary["total_steps"] += 1
+                    summary["total_input_tokens"] += model_result.input_tokens or 0
+                    summary["total_output_tokens"] += model_result.output_tokens or 0
+                    summary["total_latency_ms"] += model_result.latency_ms or 0
 
             steps_comparison.append({
                 "step_id": step.step_id,
@@ -509,7 +800,7 @@ class ScenarioService:
                 "comparisons": [c.model_dump() for c in step_comparisons]
             })
 
-        for model_name, summary in model_summaries.items():
+        for summary in model_summaries.values():
             total = summary["total_steps"]
             if total > 0:
                 summary["avg_precision"] = round(summary["total_precision"] / total, 4)
@@ -2,9 +2,17 @@
 from typing import Optional
 from app.core.database import mongodb
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# The system prompt changes rarely but is read on every chat turn and
+# scenario execution; a short process-local TTL absorbs those reads
+# without a Mongo round-trip while still picking up edits made by other
+# replicas within a minute
+PROMPT_CACHE_TTL_SECONDS = 60.0
+
 DEFAULT_SYSTEM_PROMPT = """<SYSTEM_INSTRUCTIONS>
 <ROLE>You are an AI Customer Service Expert for a Greek e-commerce platform. You communicate exclusively in Greek. Your persona is professional, efficient, and warm. Your primary goal is to assist customers with order creation and management while strictly adhering to database constraints. You will be given the user audio.</ROLE>
 
@@ -75,17 +83,34 @@ class SettingsService:
     def __init__(self):
         self.collection_name = "settings"
         self.settings_id = "global_settings"
+        self._cached_prompt: Optional[str] = None
+        self._cache_expires = 0.0
+        self._cache_lock = threading.Lock()
+
+    def _cache_prompt(self, prompt: str):
+        with self._cache_lock:
+            self._cached_prompt = prompt
+            self._cache_expires = time.monotonic() + PROMPT_CACHE_TTL_SECONDS
 
     def get_system_prompt(self) -> str:
         """Get the default system prompt from database, or return default"""
+        with self._cache_lock:
+            if self._cached_prompt is not None and time.monotonic() < self._cache_expires:
+                return self._cached_prompt
+
         try:
             if mongodb.is_connected():
                 collection = mongodb.get_collection(self.collection_name)
-                doc = collection.find_one({"_id": self.settings_id})
+                # Decode only the prompt field on the cache-miss path
+                doc = collection.find_one(
+                    {"_id": self.settings_id},
+                    {"system_prompt": 1, "_id": 0}
+                )
                 if doc and "system_prompt" in doc:
+                    self._cache_prompt(doc["system_prompt"])
                     return doc["system_prompt"]
         except Exception as e:
-            logger.error(f"Error getting system prompt from DB: {e}")
+            logger.error("Error getting system prompt from DB: %s", e)
 
         return DEFAULT_SYSTEM_PROMPT
 
@@ -99,10 +124,11 @@ class SettingsService:
                     {"$set": {"system_prompt": prompt}},
                     upsert=True
                 )
+                self._cache_prompt(prompt)
                 logger.info("System prompt saved to database")
                 return True
         except Exception as e:
-            logger.error(f"Error saving system prompt to DB: {e}")
+            logger.error("Error saving system prompt to DB: %s", e)
 
         return False
 
@@ -111,16 +137,18 @@ class SettingsService:
         try:
             if mongodb.is_connected():
                 collection = mongodb.get_collection(self.collection_name)
-                existing = collection.find_one({"_id": self.settings_id})
+                # Existence check only; skip decoding the stored prompt
+                existing = collection.find_one({"_id": self.settings_id}, {"_id": 1})
                 if not existing:
                     collection.insert_one({
                         "_id": self.settings_id,
                         "system_prompt": DEFAULT_SYSTEM_PROMPT
                     })
+                    self._cache_prompt(DEFAULT_SYSTEM_PROMPT)
                     logger.info("Default system prompt initialized in database")
                     return True
         except Exception as e:
-            logger.error(f"Error initializing default prompt: {e}")
+            logger.error("Error initializing default prompt: %s", e)
 
         return False
 
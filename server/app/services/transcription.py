@@ -1,24 +1,62 @@
+import asyncio
+import threading
 import vertexai
 from vertexai.generative_models import GenerativeModel, Part
 from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
 import logging
 from app.core.config import settings
 import os
 
 logger = logging.getLogger(__name__)
 
+# Built once at import instead of per call on the transcription hot path;
+# read-only view, matching the audio MIME map in the chat service
+_MIME_TYPES = MappingProxyType({
+    ".wav": "audio/wav",
+    ".mp3": "audio/mp3",
+    ".mpeg": "audio/mpeg",
+    ".flac": "audio/flac",
+    ".webm": "audio/webm",
+    ".ogg": "audio/ogg",
+    ".m4a": "audio/mp4",
+})
+
+_PROMPT_TEMPLATE = """Transcribe the following audio in {language}.
+Provide ONLY the transcription text, without any additional comments or explanations.
+The audio is from a customer ordering products at a tobacco shop."""
+
 
 class TranscriptionService:
     def __init__(self):
-        self.model = None
-        self._initialize_gemini()
+        # Initialization is deferred to first use: the singleton is built at
+        # import time, and eagerly calling vertexai.init there blocks module
+        # import (and every uvicorn worker's cold start) on credential I/O
+        self._model: Optional[GenerativeModel] = None
+        self._init_lock = threading.Lock()
+        self._init_attempted = False
+
+    @property
+    def model(self) -> Optional[GenerativeModel]:
+        """The Vertex model, initialized lazily on first access"""
+        if self._model is None and not self._init_attempted:
+            with self._init_lock:
+                if self._model is None and not self._init_attempted:
+                    self._init_attempted = True
+                    try:
+                        self._initialize_gemini()
+                    except Exception:
+                        # Already logged; callers treat None as uninitialized
+                        pass
+        return self._model
 
     def _initialize_gemini(self):
         """Initialize Gemini model for transcription"""
         try:
             creds_path = Path(settings.GOOGLE_APPLICATION_CREDENTIALS)
             if not creds_path.exists():
-                logger.error(f"Service account file not found: {creds_path}")
+                logger.error("Service account file not found: %s", creds_path)
                 return
 
             os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = str(creds_path)
@@ -28,57 +66,70 @@ class TranscriptionService:
                 location=settings.GCP_LOCATION
             )
 
-            self.model = GenerativeModel("gemini-2.0-flash-exp")
+            self._model = GenerativeModel("gemini-2.0-flash-exp")
             logger.info("Gemini transcription service initialized successfully")
 
         except Exception as e:
-            logger.error(f"Failed to initialize Gemini for transcription: {e}")
+            logger.error("Failed to initialize Gemini for transcription: %s", e)
             raise
 
-    async def transcribe_audio_file(self, file_path: str, language: str = "Greek") -> str:
-        """Transcribe an audio file using Gemini"""
+    async def warmup(self):
+        """Open the transcription model's upstream channel at startup"""
         if not self.model:
-            raise ValueError("Gemini model not initialized")
-
+            return
         try:
-            logger.info(f"Transcribing audio file with Gemini: {file_path}")
+            await asyncio.to_thread(self.model.count_tokens, "ping")
+            logger.info("Warmed up transcription model connection")
+        except Exception as e:
+            logger.warning("Transcription warmup failed: %s", e)
 
-            with open(file_path, "rb") as audio_file:
-                audio_data = audio_file.read()
+    def mime_type_for_suffix(self, suffix: str) -> str:
+        """Map a file suffix (e.g. '.wav') to the audio MIME type for Gemini"""
+        return _MIME_TYPES.get(suffix.lower(), "audio/wav")
 
-            file_ext = Path(file_path).suffix.lower()
-            mime_type_map = {
-                ".wav": "audio/wav",
-                ".mp3": "audio/mp3",
-                ".mpeg": "audio/mpeg",
-                ".flac": "audio/flac",
-                ".webm": "audio/webm",
-                ".ogg": "audio/ogg",
-                ".m4a": "audio/mp4",
-            }
+    async def transcribe_audio_bytes(self, audio_data: bytes, mime_type: str, language: str = "Greek") -> str:
+        """Transcribe in-memory audio bytes using Gemini"""
+        if not self.model:
+            raise ValueError("Gemini model not initialized")
 
-            mime_type = mime_type_map.get(file_ext, "audio/wav")
+        try:
+            logger.info("Transcribing %d bytes of audio with Gemini (%s)", len(audio_data), mime_type)
 
             audio_part = Part.from_data(data=audio_data, mime_type=mime_type)
 
-            prompt = f"""Transcribe the following audio in {language}.
-Provide ONLY the transcription text, without any additional comments or explanations.
-The audio is from a customer ordering products at a tobacco shop."""
+            prompt = _PROMPT_TEMPLATE.format(language=language)
 
-            response = self.model.generate_content([prompt, audio_part])
+            # The Vertex round trip is seconds long; keep it off the loop
+            response = await asyncio.to_thread(
+                self.model.generate_content, [prompt, audio_part]
+            )
             transcription = response.text.strip()
 
             if not transcription:
-                logger.warning(f"No transcription results for file: {file_path}")
+                logger.warning("No transcription results for audio")
                 return ""
 
-            logger.info(f"Transcription successful: {transcription[:100]}...")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Transcription successful: %s...", transcription[:100])
             return transcription
 
         except Exception as e:
-            logger.error(f"Error transcribing audio file {file_path}: {e}", exc_info=True)
+            logger.error("Error transcribing audio: %s", e, exc_info=True)
             raise
 
+    async def transcribe_audio_file(self, file_path: str, language: str = "Greek") -> str:
+        """Transcribe an audio file using Gemini"""
+        logger.info("Transcribing audio file with Gemini: %s", file_path)
+
+        # Multi-MB reads would otherwise block the event loop; a worker
+        # thread releases the GIL for the duration of the disk read
+        audio_data = await asyncio.to_thread(Path(file_path).read_bytes)
+
+        # A string slice beats constructing a second Path just for the suffix
+        dot = file_path.rfind('.')
+        mime_type = self.mime_type_for_suffix(file_path[dot:]) if dot != -1 else "audio/wav"
+        return await self.transcribe_audio_bytes(audio_data, mime_type, language)
+
 
 # Singleton instance
 transcription_service = TranscriptionService()
@@ -1,28 +1,49 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from app.models import ChatRequest, ChatResponse, ChatHistory
 from app.services import chat_service
 from app.core import settings
 from app.routes import scenario_router, product_router, settings_router
 from pathlib import Path
+import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
+
+# Handlers enqueue records instead of holding the logging lock across a
+# stderr write() syscall inside async request handlers; a background
+# listener thread owns the actual stream writes. basicConfig attaches its
+# default formatter to the QueueHandler, so the emitted lines are unchanged.
+_log_queue: queue.Queue = queue.Queue(-1)
+logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="AVO_NEXT Voice Ordering Test API",
     description="FastAPI server with Google Gemini AI integration and voice ordering scenario testing",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the large scenario/comparison payloads several times
+    # faster than the stdlib JSON encoder
+    default_response_class=ORJSONResponse
 )
 
+# Explicit origins instead of "*": Starlette then answers with a simple
+# set-membership check (and wildcard + credentials is spec-invalid anyway);
+# max_age lets browsers reuse one preflight for a whole session
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.CORS_ALLOW_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
 # Include routers
@@ -30,10 +51,45 @@ app.include_router(scenario_router)
 app.include_router(product_router)
 app.include_router(settings_router)
 
+@app.on_event("startup")
+async def init_db():
+    """Connect MongoDB in the worker process (clients must not cross forks)"""
+    from app.core.database import mongodb
+    mongodb.connect()
+
+
+@app.on_event("startup")
+async def warmup_llm_clients():
+    """Pre-open upstream LLM connections so the first execute doesn't pay for them"""
+    from app.models.scenario import MODELS_TO_EXECUTE
+    from app.services.order_generation import order_generation_service
+    from app.services.transcription import transcription_service
+    await asyncio.gather(
+        *(chat_service.warmup(model_name) for model_name in MODELS_TO_EXECUTE),
+        transcription_service.warmup(),
+        order_generation_service.warmup()
+    )
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with an explicit Cache-Control header on served files.
+
+    One hour is long enough that replaying a step's audio doesn't re-download
+    it, but uploads are overwritten in place at a stable URL when a step's
+    recording is replaced, so long-lived/immutable caching would serve stale
+    audio after a re-upload.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers.setdefault("Cache-Control", "public, max-age=3600")
+        return response
+
+
 # Mount static files for voice uploads
 uploads_dir = Path("uploads")
 uploads_dir.mkdir(parents=True, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
+app.mount("/uploads", CachedStaticFiles(directory=str(uploads_dir)), name="uploads")
 
 
 @app.get("/")
@@ -74,7 +130,7 @@ async def send_message(request: ChatRequest):
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        logger.error(f"Error in send_message: {e}")
+        logger.error("Error in send_message: %s", e)
         raise HTTPException(status_code=500, detail="An error occurred while processing your request")
 
 
@@ -85,7 +141,7 @@ async def get_history(session_id: str):
         messages = chat_service.get_session_history(session_id)
         return ChatHistory(session_id=session_id, messages=messages)
     except Exception as e:
-        logger.error(f"Error getting history: {e}")
+        logger.error("Error getting history: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve chat history")
 
 
@@ -96,10 +152,17 @@ async def clear_history(session_id: str):
         chat_service.clear_session(session_id)
         return {"message": f"Session {session_id} cleared successfully"}
     except Exception as e:
-        logger.error(f"Error clearing session: {e}")
+        logger.error("Error clearing session: %s", e)
         raise HTTPException(status_code=500, detail="Failed to clear session")
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop (libuv event loop) and httptools (C HTTP parser) cut
+    # per-request framing overhead; neither supports Windows, where the
+    # default asyncio/h11 stack is kept for local development
+    if sys.platform == "win32":
+        uvicorn.run(app, host="0.0.0.0", port=8000)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
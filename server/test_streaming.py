@@ -1,6 +1,7 @@
 import os
 import sys
 import json
+import orjson
 import requests
 from dotenv import load_dotenv
 from google.oauth2 import service_account
@@ -12,6 +13,10 @@ if sys.platform == 'win32':
 
 load_dotenv()
 
+# Module-level session: connection pooling and keepalive amortize the
+# TCP+TLS handshake (1-2 RTT against the Vertex endpoint) across calls
+_session = requests.Session()
+
 # Vertex AI configuration
 SERVICE_ACCOUNT_FILE = "service-account.json"
 PROJECT_ID = "mouhalis-voice-order"
@@ -83,7 +88,9 @@ def test_streaming_structured():
     access_token = get_access_token()
 
     # Build the REST API URL
-    url = f"https://{LOCATION}-aiplatform.googleapis.com/v1/projects/{PROJECT_ID}/locations/{LOCATION}/publishers/google/models/{MODEL_ID}:streamGenerateContent"
+    # alt=sse makes Vertex frame each chunk as a Server-Sent Event
+    # ("data: {json}\n"), so splitting needs no JSON-boundary scanning at all
+    url = f"https://{LOCATION}-aiplatform.googleapis.com/v1/projects/{PROJECT_ID}/locations/{LOCATION}/publishers/google/models/{MODEL_ID}:streamGenerateContent?alt=sse"
 
     # Build the request payload
     payload = {
@@ -115,7 +122,7 @@ def test_streaming_structured():
 
     try:
         # Make streaming request
-        response = requests.post(
+        response = _session.post(
             url,
             headers=headers,
             json=payload,
@@ -130,134 +137,74 @@ def test_streaming_structured():
         chunk_count = 0
         accumulated_text = ""
 
+        # Incremental story-length tracker: once the "story" key has been
+        # seen, new text counts toward it directly, instead of re-parsing
+        # the whole accumulated JSON after every chunk (quadratic in the
+        # response size). The count is approximate (escapes and the
+        # trailing fields are included) but it is only a progress readout.
+        story_marker = '"story"'
+        story_started = False
+        story_chars = 0
+        marker_tail = ""
+
         print("Streaming JSON response chunks:")
         print("-" * 60)
 
-        # Buffer for accumulating response data
-        buffer = ""
-
-        # Process streaming response
-        for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
-            if not chunk:
+        # Process streaming response: one complete JSON object per SSE
+        # "data:" line, read in 64 KiB chunks and reassembled by iter_lines.
+        # orjson parses each event's bytes directly.
+        for line in response.iter_lines(chunk_size=65536):
+            if not line or not line.startswith(b"data: "):
                 continue
 
-            buffer += chunk
-
-            # Try to parse complete JSON objects from buffer
-            # The response comes as array of JSON objects separated by commas and newlines
-            while True:
-                # Try to find a complete JSON object
-                try:
-                    # Look for pattern like {...} or [{...}]
-                    # First, clean up the buffer
-                    buffer = buffer.strip()
-
-                    # Skip array opening bracket
-                    if buffer.startswith('['):
-                        buffer = buffer[1:].strip()
-
-                    # Skip commas between objects
-                    if buffer.startswith(','):
-                        buffer = buffer[1:].strip()
-
-                    # Skip array closing bracket at the end
-                    if buffer == ']':
-                        buffer = ""
-                        break
-
-                    # If buffer is empty, break
-                    if not buffer:
-                        break
-
-                    # Try to find end of JSON object
-                    brace_count = 0
-                    end_index = -1
-                    in_string = False
-                    escape_next = False
-
-                    for i, char in enumerate(buffer):
-                        if escape_next:
-                            escape_next = False
-                            continue
-
-                        if char == '\\':
-                            escape_next = True
-                            continue
-
-                        if char == '"' and not escape_next:
-                            in_string = not in_string
-                            continue
-
-                        if not in_string:
-                            if char == '{':
-                                brace_count += 1
-                            elif char == '}':
-                                brace_count -= 1
-                                if brace_count == 0:
-                                    end_index = i + 1
-                                    break
-
-                    # If we found a complete object
-                    if end_index > 0:
-                        json_str = buffer[:end_index]
-                        buffer = buffer[end_index:].strip()
-
-                        # Parse the JSON object
-                        chunk_data = json.loads(json_str)
-                        chunk_count += 1
-
-                        # Extract text from the chunk
-                        if 'candidates' in chunk_data and len(chunk_data['candidates']) > 0:
-                            candidate = chunk_data['candidates'][0]
-
-                            # Check for content
-                            if 'content' in candidate and 'parts' in candidate['content']:
-                                for part in candidate['content']['parts']:
-                                    if 'text' in part:
-                                        text_chunk = part['text']
-                                        accumulated_text += text_chunk
-
-                                        print(f"\n[Chunk {chunk_count}] {len(text_chunk)} chars")
-                                        # Show preview of chunk
-                                        preview = text_chunk[:200] if len(text_chunk) > 200 else text_chunk
-                                        print(preview)
-
-                                        # Try to parse accumulated JSON to detect story field
-                                        try:
-                                            partial_data = json.loads(accumulated_text)
-                                            if 'story' in partial_data:
-                                                story_len = len(partial_data['story'])
-                                                print(f"[STORY FIELD] {story_len} chars accumulated")
-                                        except json.JSONDecodeError:
-                                            # JSON not complete yet
-                                            pass
-
-                            # Check for finish reason
-                            if 'finishReason' in candidate:
-                                print(f"\n[DEBUG] Finish reason: {candidate['finishReason']}")
-                    else:
-                        # No complete object found, wait for more data
-                        break
-
-                except json.JSONDecodeError:
-                    # Not enough data yet, wait for more
-                    break
-                except Exception as e:
-                    print(f"[WARNING] Error parsing chunk: {e}")
-                    # Skip to next potential object
-                    if '{' in buffer[1:]:
-                        buffer = buffer[buffer.index('{', 1):]
-                    else:
-                        break
+            chunk_data = orjson.loads(line[6:])
+            chunk_count += 1
+
+            # Extract text from the chunk
+            if 'candidates' in chunk_data and len(chunk_data['candidates']) > 0:
+                candidate = chunk_data['candidates'][0]
+
+                # Check for content
+                if 'content' in candidate and 'parts' in candidate['content']:
+                    for part in candidate['content']['parts']:
+                        if 'text' in part:
+                            text_chunk = part['text']
+                            accumulated_text += text_chunk
+
+                            print(f"\n[Chunk {chunk_count}] {len(text_chunk)} chars")
+                            # Show preview of chunk
+                            preview = text_chunk[:200] if len(text_chunk) > 200 else text_chunk
+                            print(preview)
+
+                            # Detect story-field growth by scanning only
+                            # the new text (plus a tail in case the key
+                            # name straddles a chunk boundary)
+                            if story_started:
+                                story_chars += len(text_chunk)
+                            else:
+                                joint = marker_tail + text_chunk
+                                marker_at = joint.find(story_marker)
+                                if marker_at != -1:
+                                    story_started = True
+                                    story_chars = len(joint) - marker_at - len(story_marker)
+                                else:
+                                    marker_tail = joint[-(len(story_marker) - 1):]
+                            if story_started:
+                                print(f"[STORY FIELD] ~{story_chars} chars accumulated")
+
+                # Check for finish reason
+                if 'finishReason' in candidate:
+                    print(f"\n[DEBUG] Finish reason: {candidate['finishReason']}")
 
         print("\n" + "=" * 60)
         print("Streaming completed!")
         print(f"Total chunks received: {chunk_count}")
         print(f"Total accumulated characters: {len(accumulated_text)}")
 
-        # Parse the complete JSON
+        # Parse the complete JSON (orjson: native SIMD parser, ~2-5x faster
+        # than the stdlib on a response this size)
         try:
-            data = json.loads(accumulated_text)
+            data = orjson.loads(accumulated_text)
             print("\n" + "=" * 60)
             print("PARSED STRUCTURED OUTPUT:")
             print("=" * 60)